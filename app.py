@@ -1,22 +1,24 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import os
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import cached_property
 import base64
+import hashlib
+import os
 import re
+import time
 
 # BLOCK NLTK COMPLETELY
 import sys
 class FakeNLTK:
     def download(self, *args, **kwargs): pass
     def data(self, *args, **kwargs): return type('obj', (object,), {'find': lambda x: False})()
-sys.modules['nltk'] = FakeNLTK()
+# Streamlit re-executes this script on every interaction; patch only on the first run
+if 'nltk' not in sys.modules:
+    sys.modules['nltk'] = FakeNLTK()
 
 # Import your custom modules AFTER blocking NLTK
+from utils.parse_cache import ParseCache
 from utils.resume_parser import ResumeParser
 
 # Create simple mock classes to avoid importing problematic files
@@ -44,7 +46,7 @@ class AIAnalyzer:
         }
 
 class JobMatcher:
-    def match_resume_to_jobs(self, resume_data):
+    def match_resume_to_jobs(self, resume_data, top_n=5):
         sample_jobs = [
             {
                 'title': 'Software Developer',
@@ -67,7 +69,208 @@ class JobMatcher:
                 'description': 'Analyze data and create reports to drive business decisions.'
             }
         ]
-        return sample_jobs
+        return sample_jobs[:top_n]
+
+# Shared, analysed uploads kept per server process (the same resume from any session hits)
+ANALYSIS_CACHE_ENTRIES = 256
+# Distinct API keys whose analyzers are kept per server process
+AI_ANALYZER_ENTRIES = 16
+# Uploads analysed at once per server process; the rest wait in the pool's queue
+ANALYSIS_WORKERS = 4
+# How often the upload queue refreshes while files are still being analysed
+QUEUE_POLL_SECONDS = 1.0
+# Matches kept per analysed resume; the Job Matches tab filters and pages through them
+JOB_MATCH_LIMIT = 500
+# Rows sent to the browser per table page, however many results there are
+TABLE_PAGE_SIZE = 25
+
+@st.cache_resource(show_spinner=False)
+def get_parser():
+    """One parser per server process; taxonomy automaton and rules are built once"""
+    # Reruns and repeat uploads of the same file are served from the on-disk cache
+    return ResumeParser(cache=ParseCache())
+
+@st.cache_resource(show_spinner=False)
+def get_job_matcher():
+    """One job index per server process, shared by every session"""
+    # sklearn is imported lazily while the index is built, so construction is guarded too
+    try:
+        from utils.job_matcher import JobMatcher as IndexedJobMatcher
+        snapshot = os.environ.get('JOB_INDEX_SNAPSHOT')
+        if snapshot:
+            return IndexedJobMatcher.from_snapshot(snapshot)
+        return IndexedJobMatcher()
+    except ImportError:
+        return JobMatcher()
+
+@st.cache_resource(max_entries=AI_ANALYZER_ENTRIES, show_spinner=False)
+def get_ai_analyzer(api_key: str = None):
+    """One analyzer per API key per server process; they share pooled OpenAI clients"""
+    if api_key:
+        try:
+            from utils.ai_analyzer import AIAnalyzer as OpenAIAnalyzer
+            return OpenAIAnalyzer(api_key)
+        except ImportError:
+            pass
+    return AIAnalyzer(api_key)
+
+class AnalysisResult:
+    """One analysed upload; derived views are built on first render and reused"""
+    def __init__(self, resume_data, ai_analysis, job_matches):
+        self.resume_data = resume_data
+        self.ai_analysis = ai_analysis
+        self.job_matches = job_matches
+
+    @cached_property
+    def score_cards(self):
+        return [
+            ("Overall Score", self.ai_analysis.get('overall_score', 0), "Total assessment score"),
+            ("ATS Score", self.ai_analysis.get('ats_optimization_score', 0), "Applicant Tracking System"),
+            ("Skills Found", sum(len(skills) for skills in self.resume_data.get('skills', {}).values()),
+             "Technical skills"),
+            ("Experience", len(self.resume_data.get('experience', [])), "Work experience items")
+        ]
+
+    @cached_property
+    def skill_rows(self):
+        return [
+            {"Category": category.replace('_', ' ').title(), "Skill": skill}
+            for category, skills in self.resume_data.get('skills', {}).items() for skill in skills
+        ]
+
+    @cached_property
+    def skills_by_category(self):
+        groups = {}
+        for row in self.skill_rows:
+            groups.setdefault(row["Category"], []).append(row)
+        return groups
+
+    @cached_property
+    def job_rows(self):
+        """Job matches flattened into table rows once, however often they are paged"""
+        return [{
+            "Match Score": job['match_score'],
+            "Title": job['title'],
+            "Company": job.get('company', ''),
+            "Experience Level": job.get('experience_level', ''),
+            "Salary Range": job.get('salary_range', ''),
+            "Matching Skills": ', '.join(job.get('matching_skills', [])),
+            "Missing Skills": ', '.join(job.get('missing_skills', []))
+        } for job in self.job_matches or []]
+
+    @cached_property
+    def experience_levels(self):
+        return sorted({row["Experience Level"] for row in self.job_rows if row["Experience Level"]})
+
+    @cached_property
+    def missing_skills(self):
+        return sorted({skill for job in self.job_matches or [] for skill in job.get('missing_skills', [])})
+
+    def filter_jobs(self, min_score=0, levels=(), missing_skill=None):
+        """Rows passing the filters; the last result is kept so paging does not refilter"""
+        key = (min_score, tuple(levels), missing_skill)
+        cached = self.__dict__.get('_job_filter')
+        if cached is None or cached[0] != key:
+            rows = [
+                row for row, job in zip(self.job_rows, self.job_matches)
+                if (not isinstance(row["Match Score"], (int, float)) or row["Match Score"] >= min_score)
+                and (not levels or row["Experience Level"] in levels)
+                and (missing_skill is None or missing_skill in job.get('missing_skills', []))
+            ]
+            cached = self.__dict__['_job_filter'] = (key, rows)
+        return cached[1]
+
+    def bullets(self, key, template="• {}"):
+        """Markdown list of an AI analysis field"""
+        cache = self.__dict__.setdefault('_bullets', {})
+        if (key, template) not in cache:
+            cache[key, template] = '\n\n'.join(template.format(item) for item in self.ai_analysis.get(key, []))
+        return cache[key, template]
+
+@st.cache_resource(max_entries=ANALYSIS_CACHE_ENTRIES, show_spinner=False)
+def get_analysis(content_key: str, api_key_digest: str, _data: bytes, _api_key: str = None, _progress=None):
+    """Parse, analyse and match an upload once per content and API key, for all sessions"""
+    progress = _progress or (lambda stage: None)
+    # Parse resume straight from memory; the type comes from its magic bytes
+    progress('Parsing')
+    resume_data = get_parser().parse_resume(_data)
+    progress('Analysing')
+    ai_analysis = get_ai_analyzer(_api_key).analyze_resume(resume_data)
+    progress('Matching')
+    job_matches = get_job_matcher().match_resume_to_jobs(resume_data, top_n=JOB_MATCH_LIMIT)
+    return AnalysisResult(resume_data, ai_analysis, job_matches)
+
+@st.cache_resource(show_spinner=False)
+def get_analysis_pool():
+    """Background workers shared by every session, so an upload never blocks a rerun"""
+    return ThreadPoolExecutor(max_workers=ANALYSIS_WORKERS, thread_name_prefix='resume-analysis')
+
+class UploadJob:
+    """One queued upload; the worker advances its stage and the queue panel reads it"""
+    PROGRESS = {'Queued': 0.0, 'Parsing': 0.1, 'Analysing': 0.4, 'Matching': 0.8}
+
+    def __init__(self, name, size):
+        self.name = name
+        self.size = size
+        self.stage = 'Queued'
+        self.future = None
+        self.finished_at = None
+
+    def set_stage(self, stage):
+        self.stage = stage
+
+    def finish(self, future):
+        self.finished_at = time.monotonic()
+
+    @property
+    def done(self):
+        # Set by the future's done callback, so completion order is recorded too
+        return self.finished_at is not None
+
+    @property
+    def analysis(self):
+        """The finished analysis, or None while pending or after a failure"""
+        if not self.done or self.future.exception() is not None:
+            return None
+        return self.future.result()
+
+    @property
+    def error(self):
+        if not self.done:
+            return None
+        if self.future.exception() is not None:
+            return str(self.future.exception())
+        return self.future.result().resume_data.get('error')
+
+    def result_row(self):
+        """Row of the incrementally filled results table"""
+        analysis = self.analysis
+        if analysis is None or self.error:
+            return {"File": self.name, "Status": f"❌ {self.error}"}
+        top_match = (analysis.job_matches or [{}])[0]
+        return {
+            "File": self.name,
+            "Status": "✅ Done",
+            "Overall Score": analysis.ai_analysis.get('overall_score'),
+            "ATS Score": analysis.ai_analysis.get('ats_optimization_score'),
+            "Skills Found": sum(len(skills) for skills in analysis.resume_data.get('skills', {}).values()),
+            "Top Match": top_match.get('title'),
+            "Match Score": top_match.get('match_score')
+        }
+
+def analyze_upload(job, content_key, api_key_digest, data, api_key):
+    """Worker-thread body: no Streamlit elements here, progress goes through the job"""
+    return get_analysis(content_key, api_key_digest, data, api_key, _progress=job.set_stage)
+
+def match_css_class(score):
+    """Card style for a score"""
+    if not isinstance(score, (int, float)):
+        return "match-medium"
+    if score >= 80:
+        return "match-high"
+    if score >= 60:
+        return "match-medium"
+    return "match-low"
 
 # Page configuration
 st.set_page_config(
@@ -118,9 +321,11 @@ def load_css():
 
 class ResumeAnalyzerApp:
     def __init__(self):
-        self.parser = ResumeParser()
-        self.job_matcher = JobMatcher()
+        # Process-wide engines; constructing the app on a rerun costs nothing
+        self.parser = get_parser()
+        self.job_matcher = get_job_matcher()
         self.ai_analyzer = None
+        self.api_key = None
         
         # Initialize session state
         if 'analysis_complete' not in st.session_state:
@@ -131,6 +336,10 @@ class ResumeAnalyzerApp:
             st.session_state.ai_analysis = None
         if 'job_matches' not in st.session_state:
             st.session_state.job_matches = None
+        if 'analysis' not in st.session_state:
+            st.session_state.analysis = None
+        if 'upload_jobs' not in st.session_state:
+            st.session_state.upload_jobs = {}
 
     def run(self):
         """Main application runner"""
@@ -180,7 +389,9 @@ class ResumeAnalyzerApp:
             )
             
             if api_key:
-                self.ai_analyzer = AIAnalyzer(api_key)
+                # Cached per key: reruns and re-entering a key reuse the analyzer and its client
+                self.api_key = api_key
+                self.ai_analyzer = get_ai_analyzer(api_key)
             
             st.markdown("---")
             st.header("📈 Features")
@@ -194,86 +405,101 @@ class ResumeAnalyzerApp:
 
     def render_upload_section(self):
         """Render resume upload section"""
-        st.header("📤 Upload Your Resume")
+        st.header("📤 Upload Your Resumes")
         
-        uploaded_file = st.file_uploader(
-            "Choose your resume file (PDF or DOCX)",
+        uploaded_files = st.file_uploader(
+            "Choose resume files (PDF or DOCX)",
             type=['pdf', 'docx'],
-            help="Supported formats: PDF, DOCX"
+            accept_multiple_files=True,
+            help="Supported formats: PDF, DOCX. Drop several at once; each is analysed in the background."
         )
         
-        if uploaded_file is not None:
-            # Display file info
-            file_details = {
-                "Filename": uploaded_file.name,
-                "File size": f"{uploaded_file.size / 1024:.1f} KB",
-                "File type": uploaded_file.type
-            }
-            
-            st.json(file_details)
+        if uploaded_files:
+            total_size = sum(uploaded_file.size for uploaded_file in uploaded_files)
+            st.caption(f"{len(uploaded_files)} file(s), {total_size / 1024:.1f} KB in total")
             
-            # Process file
-            if st.button("🚀 Analyze Resume", type="primary", use_container_width=True):
-                with st.spinner("Analyzing your resume..."):
-                    self.process_resume(uploaded_file)
+            # Queue files; workers pick them up and this run returns immediately
+            if st.button(f"🚀 Analyze {len(uploaded_files)} Resume(s)", type="primary", use_container_width=True):
+                self.queue_resumes(uploaded_files)
+        
+        if st.session_state.upload_jobs:
+            self.render_upload_queue()
+            self.render_result_picker()
 
-    def process_resume(self, uploaded_file):
-        """Process the uploaded resume file"""
-        try:
-            # Save uploaded file temporarily
-            with tempfile.NamedTemporaryFile(delete=False, suffix=f".{uploaded_file.name.split('.')[-1]}") as tmp_file:
-                tmp_file.write(uploaded_file.getvalue())
-                tmp_path = tmp_file.name
-
-            # Parse resume
-            file_type = "pdf" if uploaded_file.type == "application/pdf" else "docx"
-            resume_data = self.parser.parse_resume(tmp_path, file_type)
-            
-            # AI Analysis
-            if self.ai_analyzer:
-                ai_analysis = self.ai_analyzer.analyze_resume(resume_data)
-            else:
-                ai_analysis = AIAnalyzer().analyze_resume(resume_data)
-            
-            # Job Matching
-            job_matches = self.job_matcher.match_resume_to_jobs(resume_data)
-            
-            # Update session state
-            st.session_state.resume_data = resume_data
-            st.session_state.ai_analysis = ai_analysis
-            st.session_state.job_matches = job_matches
-            st.session_state.analysis_complete = True
-            
-            # Cleanup
-            os.unlink(tmp_path)
-            
-            st.success("✅ Analysis complete! Navigate to other tabs to see results.")
-            
-        except Exception as e:
-            st.error(f"❌ Error processing resume: {str(e)}")
+    def queue_resumes(self, uploaded_files):
+        """Submit uploads to the background pool, skipping ones already queued with this API key"""
+        pool = get_analysis_pool()
+        jobs = st.session_state.upload_jobs
+        api_key_digest = hashlib.sha256(self.api_key.encode('utf-8')).hexdigest() if self.api_key else ''
+        for uploaded_file in uploaded_files:
+            data = uploaded_file.getvalue()
+            content_key = ParseCache.make_key(data, self.parser.version)
+            job_key = f"{content_key}:{api_key_digest}"
+            if job_key in jobs and not (jobs[job_key].done and jobs[job_key].error):
+                continue
+            job = UploadJob(uploaded_file.name, uploaded_file.size)
+            job.future = pool.submit(analyze_upload, job, content_key, api_key_digest, data, self.api_key)
+            job.future.add_done_callback(job.finish)
+            jobs[job_key] = job
+
+    def render_upload_queue(self):
+        """Per-file progress and the results table; only this panel reruns while files are pending"""
+        pending = any(not job.done for job in st.session_state.upload_jobs.values())
+        st.fragment(self._render_upload_queue, run_every=QUEUE_POLL_SECONDS if pending else None)()
+
+    def _render_upload_queue(self):
+        jobs = list(st.session_state.upload_jobs.values())
+        finished = [job for job in jobs if job.done]
+        st.progress(len(finished) / len(jobs), text=f"Analysed {len(finished)} of {len(jobs)} resume(s)")
+        for job in jobs:
+            if not job.done:
+                st.progress(UploadJob.PROGRESS.get(job.stage, 0.0), text=f"{job.name}: {job.stage}")
+        
+        # Rows appear in completion order, so fast files never wait for the slowest one
+        finished.sort(key=lambda job: job.finished_at)
+        if finished:
+            st.dataframe([job.result_row() for job in finished], hide_index=True)
+        
+        if len(finished) == len(jobs) and st.session_state.get('queue_pending'):
+            # The last file just finished; rerun the whole app so the other tabs pick up the results
+            st.session_state.queue_pending = False
+            st.rerun()
+        st.session_state.queue_pending = len(finished) < len(jobs)
+
+    def render_result_picker(self):
+        """Choose which finished resume the analysis tabs show"""
+        jobs = st.session_state.upload_jobs
+        analysed = [job_key for job_key, job in jobs.items() if job.done and not job.error]
+        if not analysed:
+            return
+        # Keep the current choice as more files finish; default to the latest one
+        shown = [job_key for job_key in analysed if jobs[job_key].analysis is st.session_state.analysis]
+        index = analysed.index(shown[0]) if shown else len(analysed) - 1
+        if len(analysed) > 1:
+            selected = st.selectbox("Show analysis for", analysed, index=index,
+                                    format_func=lambda job_key: jobs[job_key].name)
+        else:
+            selected = analysed[0]
+        # The upload tab renders first, so the other tabs already see the choice on this run
+        self.show_analysis(jobs[selected].analysis)
+
+    def show_analysis(self, analysis):
+        """Make an analysis the one the other tabs render"""
+        # Update session state; the analysis object itself is shared, not copied
+        st.session_state.analysis = analysis
+        st.session_state.resume_data = analysis.resume_data
+        st.session_state.ai_analysis = analysis.ai_analysis
+        st.session_state.job_matches = analysis.job_matches
+        st.session_state.analysis_complete = True
 
     def render_analysis_section(self):
         """Render comprehensive analysis results"""
         st.header("📊 Resume Analysis Dashboard")
         
         # Overall Score Card
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            overall_score = st.session_state.ai_analysis.get('overall_score', 0)
-            self.render_score_card("Overall Score", overall_score, "Total assessment score")
-        
-        with col2:
-            ats_score = st.session_state.ai_analysis.get('ats_optimization_score', 0)
-            self.render_score_card("ATS Score", ats_score, "Applicant Tracking System")
-        
-        with col3:
-            skills_count = sum(len(skills) for skills in st.session_state.resume_data.get('skills', {}).values())
-            self.render_score_card("Skills Found", skills_count, "Technical skills")
-        
-        with col4:
-            exp_count = len(st.session_state.resume_data.get('experience', []))
-            self.render_score_card("Experience", exp_count, "Work experience items")
+        for column, (title, score, description) in zip(st.columns(4), st.session_state.analysis.score_cards):
+            with column:
+                self.render_score_card(title, score, description)
         
         # Detailed Analysis
         col1, col2 = st.columns(2)
@@ -288,18 +514,8 @@ class ResumeAnalyzerApp:
 
     def render_score_card(self, title, score, description):
         """Render a score card with appropriate styling"""
-        if isinstance(score, (int, float)):
-            if score >= 80:
-                css_class = "match-high"
-            elif score >= 60:
-                css_class = "match-medium"
-            else:
-                css_class = "match-low"
-        else:
-            css_class = "match-medium"
-        
         st.markdown(f"""
-        <div class="resume-card {css_class}">
+        <div class="resume-card {match_css_class(score)}">
             <h3>{title}</h3>
             <h2>{score}</h2>
             <p>{description}</p>
@@ -307,19 +523,34 @@ class ResumeAnalyzerApp:
         """, unsafe_allow_html=True)
 
     def render_skills_analysis(self):
-        """Render skills analysis visualization"""
+        """Render skills analysis as one paged table"""
         st.subheader("🛠 Technical Skills")
         
-        skills_data = st.session_state.resume_data.get('skills', {})
+        analysis = st.session_state.analysis
+        if not analysis.skill_rows:
+            st.info("No technical skills detected.")
+            return
         
-        if skills_data:
-            for category, skills in skills_data.items():
-                if skills:
-                    st.markdown(f"**{category.replace('_', ' ').title()}:**")
-                    for skill in skills:
-                        st.markdown(f"- {skill}")
+        categories = list(analysis.skills_by_category)
+        category = st.selectbox("Category", ["All"] + categories) if len(categories) > 1 else "All"
+        rows = analysis.skill_rows if category == "All" else analysis.skills_by_category[category]
+        self.render_table_page(rows, 'skills')
+
+    def render_table_page(self, rows, key, column_config=None):
+        """Render one page of rows as a single table; only that page is sent to the browser"""
+        n_pages = max(1, -(-len(rows) // TABLE_PAGE_SIZE))
+        page_key = f"{key}_page"
+        # Filters can shrink the result below the page being viewed
+        if st.session_state.get(page_key, 1) > n_pages:
+            st.session_state[page_key] = n_pages
+        
+        if n_pages > 1:
+            page = st.number_input(f"Page (of {n_pages})", min_value=1, max_value=n_pages, step=1, key=page_key)
         else:
-            st.info("No technical skills detected.")
+            page = 1
+        start = (page - 1) * TABLE_PAGE_SIZE
+        st.dataframe(rows[start:start + TABLE_PAGE_SIZE], hide_index=True, column_config=column_config)
+        st.caption(f"Showing {start + 1}–{min(start + TABLE_PAGE_SIZE, len(rows))} of {len(rows)}")
 
     def render_strengths_weaknesses(self):
         """Render strengths and weaknesses analysis"""
@@ -327,26 +558,18 @@ class ResumeAnalyzerApp:
         
         with col1:
             st.subheader("✅ Strengths")
-            strengths = st.session_state.ai_analysis.get('strengths', [])
-            for strength in strengths:
-                st.markdown(f"• {strength}")
+            st.markdown(st.session_state.analysis.bullets('strengths'))
         
         with col2:
             st.subheader("📈 Areas for Improvement")
-            weaknesses = st.session_state.ai_analysis.get('weaknesses', [])
-            for weakness in weaknesses:
-                st.markdown(f"• {weakness}")
+            st.markdown(st.session_state.analysis.bullets('weaknesses'))
 
     def render_ai_insights(self):
         """Render AI-powered insights"""
         st.subheader("🤖 Insights & Recommendations")
         
-        insights = st.session_state.ai_analysis
-        
         st.markdown("#### 🎯 Career Recommendations")
-        recommendations = insights.get('career_recommendations', [])
-        for rec in recommendations:
-            st.markdown(f"• **{rec}**")
+        st.markdown(st.session_state.analysis.bullets('career_recommendations', "• **{}**"))
 
     def render_personal_info(self):
         """Render extracted personal information"""
@@ -365,52 +588,43 @@ class ResumeAnalyzerApp:
             st.info("No contact information detected.")
 
     def render_job_matches_section(self):
-        """Render job matching results"""
+        """Render job matching results as a filtered, paged table"""
         st.header("💼 Job Recommendations")
         
         if not st.session_state.job_matches:
             st.warning("No job matches found.")
             return
         
-        # Job matches
-        for job in st.session_state.job_matches:
-            with st.container():
-                self.render_job_card(job)
-
-    def render_job_card(self, job):
-        """Render individual job match card"""
-        if job['match_score'] >= 80:
-            match_class = "match-high"
-        elif job['match_score'] >= 60:
-            match_class = "match-medium"
-        else:
-            match_class = "match-low"
-        
-        st.markdown(f"""
-        <div class="resume-card {match_class}">
-            <h3>🎯 {job['title']} at {job['company']}</h3>
-            <h4>Match Score: {job['match_score']}%</h4>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown(f"**Experience Level:** {job['experience_level']}")
-        st.markdown(f"**Salary Range:** {job['salary_range']}")
+        # Filtering and paging happen here; the browser only ever receives one page
+        analysis = st.session_state.analysis
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            min_score = st.slider("Minimum match score", 0, 100, 0)
+        with col2:
+            levels = st.multiselect("Experience level", analysis.experience_levels)
+        with col3:
+            missing_skill = st.selectbox("Missing skill", ["Any"] + analysis.missing_skills)
         
-        st.markdown("---")
+        rows = analysis.filter_jobs(min_score, levels, None if missing_skill == "Any" else missing_skill)
+        if not rows:
+            st.info("No job matches pass these filters.")
+            return
+        self.render_table_page(rows, 'jobs', column_config={
+            "Match Score": st.column_config.ProgressColumn("Match Score", format="%.1f%%", min_value=0, max_value=100)
+        })
 
     def render_improvement_plan(self):
         """Render personalized improvement plan"""
         st.header("🎯 Improvement Suggestions")
         
-        ai_analysis = st.session_state.ai_analysis
-        
         st.subheader("💡 Actionable Suggestions")
-        suggestions = ai_analysis.get('improvement_suggestions', [])
-        for suggestion in suggestions:
-            st.markdown(f"• {suggestion}")
+        st.markdown(st.session_state.analysis.bullets('improvement_suggestions'))
 
 def main():
     """Main application entry point"""
+    # Warm the shared engines; only the first run in the server process pays for them
+    get_parser()
+    get_job_matcher()
     app = ResumeAnalyzerApp()
     app.run()
 
@@ -0,0 +1,169 @@
+"""Bulk resume parsing from the command line.
+
+Walks a directory, parses every PDF/DOCX across a process pool and streams
+one JSON result per line to the output file. Paths already present in the
+output are skipped, so an interrupted run resumes where it stopped.
+
+    python batch_parse.py resumes/ parsed.jsonl --workers 8
+    python batch_parse.py resumes/ --compare-pdf-backends 50
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, Iterator, Optional, Set
+
+from utils.parse_cache import ParseCache
+from utils.pdf_backends import PDF_BACKEND_MODES, PDF_BACKENDS, compare_pdf_backends
+from utils.resume_parser import ResumeParser
+
+RESUME_EXTENSIONS = ('.pdf', '.docx')
+
+_worker_parser = None
+
+
+def _init_worker(cache_path: Optional[str], pdf_backend: str):
+    """Build one parser per worker process instead of one per file"""
+    global _worker_parser
+    _worker_parser = ResumeParser(cache=ParseCache(cache_path) if cache_path else None, pdf_backend=pdf_backend)
+
+
+def _parse_file(path: str) -> Dict:
+    """Parse a single resume inside a worker process"""
+    return {'path': path, **_worker_parser.parse_resume(path)}
+
+
+def iter_resume_files(root: str) -> Iterator[str]:
+    """Yield resume files under root in a stable order"""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if filename.lower().endswith(RESUME_EXTENSIONS):
+                yield os.path.join(dirpath, filename)
+
+
+def load_checkpoint(output_path: str) -> Set[str]:
+    """Return paths already written to the output, dropping a torn last line"""
+    done = set()
+    if not os.path.exists(output_path):
+        return done
+
+    good_size = 0
+    with open(output_path, 'rb') as output:
+        for line in output:
+            try:
+                done.add(json.loads(line)['path'])
+            except (ValueError, KeyError):
+                break
+            good_size += len(line)
+    with open(output_path, 'ab') as output:
+        output.truncate(good_size)
+    return done
+
+
+def run_batch(input_dir: str, output_path: str, workers: Optional[int] = None,
+              max_in_flight: Optional[int] = None, cache_path: Optional[str] = None,
+              pdf_backend: str = 'auto') -> Dict:
+    """Parse every resume under input_dir into a JSONL file"""
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers * 4
+    done = load_checkpoint(output_path)
+    parsed = failed = skipped = 0
+    start = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(cache_path, pdf_backend)) as pool, \
+            open(output_path, 'a', encoding='utf-8') as output:
+        pending = set()
+
+        def drain(return_when):
+            nonlocal pending, parsed, failed
+            finished, pending = wait(pending, return_when=return_when)
+            for future in finished:
+                result = future.result()
+                output.write(json.dumps(result) + '\n')
+                if result.get('error'):
+                    failed += 1
+                else:
+                    parsed += 1
+            output.flush()
+
+        for path in iter_resume_files(input_dir):
+            if path in done:
+                skipped += 1
+                continue
+            # Bounded in-flight work keeps memory flat on huge directories
+            if len(pending) >= max_in_flight:
+                drain(FIRST_COMPLETED)
+            pending.add(pool.submit(_parse_file, path))
+
+        while pending:
+            drain(FIRST_COMPLETED)
+
+    elapsed = time.perf_counter() - start
+    processed = parsed + failed
+    return {
+        'parsed': parsed,
+        'failed': failed,
+        'skipped': skipped,
+        'seconds': round(elapsed, 2),
+        'files_per_second': round(processed / elapsed, 2) if elapsed else 0.0
+    }
+
+
+def compare_backends(input_dir: str, sample_size: int) -> Dict[str, Dict]:
+    """Total per-backend extraction time over a sample of PDFs"""
+    totals = {name: {'files': 0, 'seconds': 0.0, 'chars': 0, 'garbled': 0} for name in PDF_BACKENDS}
+    pdf_paths = (path for path in iter_resume_files(input_dir) if path.lower().endswith('.pdf'))
+    for _, path in zip(range(sample_size), pdf_paths):
+        try:
+            timings = compare_pdf_backends(path)
+        except Exception:
+            continue
+        for name, timing in timings.items():
+            totals[name]['files'] += 1
+            totals[name]['seconds'] += timing['seconds']
+            totals[name]['chars'] += timing['chars']
+            totals[name]['garbled'] += int(timing['garbled'])
+    return totals
+
+
+def main(argv=None) -> int:
+    """Command-line entry point"""
+    arg_parser = argparse.ArgumentParser(description="Parse a directory of resumes into JSONL")
+    arg_parser.add_argument('input_dir', help="Directory to walk for PDF/DOCX resumes")
+    arg_parser.add_argument('output', nargs='?', help="JSONL file to write; also used as the resume checkpoint")
+    arg_parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    arg_parser.add_argument('--max-in-flight', type=int, default=None,
+                            help="Maximum queued files (default: 4 per worker)")
+    arg_parser.add_argument('--cache', default=None, help="Optional shared parse cache file")
+    arg_parser.add_argument('--pdf-backend', choices=PDF_BACKEND_MODES, default='auto',
+                            help="PDF text backend (default: auto)")
+    arg_parser.add_argument('--compare-pdf-backends', type=int, metavar='N', default=None,
+                            help="Time every PDF backend on up to N files instead of parsing")
+    args = arg_parser.parse_args(argv)
+
+    if not os.path.isdir(args.input_dir):
+        arg_parser.error(f"not a directory: {args.input_dir}")
+
+    if args.compare_pdf_backends:
+        for name, total in compare_backends(args.input_dir, args.compare_pdf_backends).items():
+            per_file = total['seconds'] / total['files'] * 1000 if total['files'] else 0.0
+            print(f"{name:>8}: {total['files']} files, {per_file:.1f} ms/file, "
+                  f"{total['chars']} chars, {total['garbled']} garbled")
+        return 0
+
+    if not args.output:
+        arg_parser.error("output is required unless --compare-pdf-backends is given")
+
+    summary = run_batch(args.input_dir, args.output, args.workers, args.max_in_flight, args.cache,
+                        args.pdf_backend)
+    print(f"Parsed {summary['parsed']} files ({summary['failed']} failed, {summary['skipped']} already done) "
+          f"in {summary['seconds']}s: {summary['files_per_second']} files/s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,35 @@
+"""Fit the latent semantic job vectors offline.
+
+Builds the job index from a JSON/JSONL feed (or the bundled sample jobs),
+fits a truncated SVD over it and writes the projection plus memory-mappable
+float32 job vectors to the output directory.
+
+    python build_semantic_index.py semantic/ --jobs jobs.jsonl --components 256
+"""
+import argparse
+import sys
+import time
+
+from utils.job_matcher import JobMatcher
+from utils.semantic_index import DEFAULT_COMPONENTS, SemanticIndex
+
+
+def main(argv=None) -> int:
+    """Command-line entry point"""
+    arg_parser = argparse.ArgumentParser(description="Fit latent semantic vectors for the job corpus")
+    arg_parser.add_argument('output_dir', help="Directory to write the projection and job vectors to")
+    arg_parser.add_argument('--jobs', default=None, help="JSON or JSONL job feed (default: sample jobs)")
+    arg_parser.add_argument('--components', type=int, default=DEFAULT_COMPONENTS,
+                            help=f"Latent dimensions (default: {DEFAULT_COMPONENTS})")
+    args = arg_parser.parse_args(argv)
+
+    started = time.perf_counter()
+    matcher = JobMatcher.from_feed(args.jobs) if args.jobs else JobMatcher()
+    semantic = SemanticIndex.fit(matcher.index, args.output_dir, n_components=args.components)
+    print(f"Fitted {semantic.vectors.shape[1]} dimensions over {len(matcher.index)} jobs "
+          f"in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
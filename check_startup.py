@@ -0,0 +1,72 @@
+"""Startup budget check for the app and the utils modules.
+
+Imports each target in a fresh interpreter, as a new Streamlit replica
+would, and fails if the import takes longer than its budget or drags in a
+library that is meant to load only on first use.
+
+    python check_startup.py
+    python check_startup.py --runs 5 --scale 2.0
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict
+
+# Seconds allowed for a cold import of each target
+STARTUP_BUDGETS = {
+    'app': 1.5,
+    'utils.resume_parser': 0.5,
+    'utils.job_matcher': 0.75,
+    'utils.ai_analyzer': 0.25,
+}
+# Heavy libraries that must not be imported until they are actually used
+LAZY_MODULES = ('sklearn', 'pandas', 'plotly', 'openai', 'pdfplumber', 'PyPDF2', 'docx')
+# Targets whose framework loads some of those itself (Streamlit imports plotly); only extras count
+BASELINES = {'app': 'streamlit'}
+
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - started
+print(json.dumps({{'seconds': seconds, 'eager': [name for name in {lazy!r} if name in sys.modules]}}))
+"""
+
+
+def measure_import(module: str) -> Dict:
+    """Import a module in a fresh interpreter and report the time and eager heavy imports"""
+    root = os.path.dirname(os.path.abspath(__file__))
+    result = subprocess.run([sys.executable, '-c', _PROBE.format(module=module, lazy=LAZY_MODULES)],
+                            cwd=root, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise Exception(f"Importing {module} failed: {result.stderr.strip()}")
+    # Streamlit may log to stdout when imported outside `streamlit run`; the probe prints last
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None) -> int:
+    """Command-line entry point"""
+    arg_parser = argparse.ArgumentParser(description="Fail if cold imports exceed their start-up budget")
+    arg_parser.add_argument('--runs', type=int, default=3, help="Fresh interpreters per target; the fastest counts")
+    arg_parser.add_argument('--scale', type=float, default=1.0, help="Multiply every budget, for slower machines")
+    args = arg_parser.parse_args(argv)
+
+    failed = False
+    for module, budget in STARTUP_BUDGETS.items():
+        runs = [measure_import(module) for _ in range(max(1, args.runs))]
+        seconds = min(run['seconds'] for run in runs)
+        eager = {name for run in runs for name in run['eager']}
+        if module in BASELINES:
+            eager -= set(measure_import(BASELINES[module])['eager'])
+        eager = sorted(eager)
+        ok = seconds <= budget * args.scale and not eager
+        failed |= not ok
+        note = f", eagerly imports {', '.join(eager)}" if eager else ""
+        print(f"{'ok  ' if ok else 'FAIL'} {module:<22} {seconds:.3f}s (budget {budget * args.scale:.2f}s){note}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
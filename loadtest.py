@@ -0,0 +1,146 @@
+"""Local load test for the HTTP analysis service.
+
+Opens a fixed number of keep-alive connections to a running ``service.py``,
+sends requests as fast as each connection allows and reports throughput and
+p50/p99 latency. For ``match`` the resume is parsed once through ``/parse``
+and the parsed JSON is posted on every request.
+
+    python service.py --port 8080 &
+    python loadtest.py resume.pdf --endpoint match --concurrency 64 --requests 5000
+    python loadtest.py resume.pdf --endpoint parse --concurrency 8 --requests 200
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from typing import Dict, List, Tuple
+
+ENDPOINTS = ('parse', 'analyze', 'match')
+
+
+class Connection:
+    """One keep-alive HTTP/1.1 connection"""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+
+    async def request(self, method: str, path: str, body: bytes = b'') -> Tuple[int, bytes]:
+        """Send a request and return the status code and response body"""
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        self.writer.write((f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\n"
+                           f"Content-Length: {len(body)}\r\n\r\n").encode('latin-1') + body)
+        await self.writer.drain()
+
+        status = int((await self.reader.readline()).split()[1])
+        headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        payload = await self.reader.readexactly(int(headers.get('content-length', 0)))
+        if headers.get('connection', '').lower() == 'close':
+            self.close()
+        return status, payload
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))]
+
+
+async def run_load(host: str, port: int, path: str, body: bytes, concurrency: int, total: int) -> Dict:
+    """Issue ``total`` requests over ``concurrency`` connections"""
+    latencies: List[float] = []
+    errors: Dict[int, int] = {}
+    remaining = total
+
+    async def client():
+        nonlocal remaining
+        connection = Connection(host, port)
+        try:
+            while remaining > 0:
+                remaining -= 1
+                started = time.perf_counter()
+                try:
+                    status, _ = await connection.request('POST', path, body)
+                except (ConnectionError, asyncio.IncompleteReadError, ValueError, IndexError):
+                    connection.close()
+                    status = 0
+                latencies.append(time.perf_counter() - started)
+                if status != 200:
+                    errors[status] = errors.get(status, 0) + 1
+        finally:
+            connection.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'seconds': round(elapsed, 2),
+        'requests_per_second': round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 1),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 1),
+        'max_ms': round(latencies[-1] * 1000, 1) if latencies else 0.0
+    }
+
+
+async def load_test(args) -> Dict:
+    with open(args.resume, 'rb') as handle:
+        body = handle.read()
+    if args.endpoint == 'match':
+        connection = Connection(args.host, args.port)
+        status, body = await connection.request('POST', '/parse', body)
+        connection.close()
+        if status != 200:
+            raise Exception(f"Parsing {args.resume} for the match body failed: {body.decode('utf-8', 'replace')}")
+
+    path = f"/{args.endpoint}" + (f"?top_n={args.top_n}" if args.endpoint != 'parse' else '')
+    # Warm up the connection pool, worker processes and matcher before measuring
+    await run_load(args.host, args.port, path, body, args.concurrency, args.concurrency)
+    return await run_load(args.host, args.port, path, body, args.concurrency, args.requests)
+
+
+def main(argv=None) -> int:
+    """Command-line entry point"""
+    arg_parser = argparse.ArgumentParser(description="Measure latency and throughput of service.py")
+    arg_parser.add_argument('resume', help="PDF/DOCX resume to send")
+    arg_parser.add_argument('--host', default='127.0.0.1', help="Service host (default: 127.0.0.1)")
+    arg_parser.add_argument('--port', type=int, default=8080, help="Service port (default: 8080)")
+    arg_parser.add_argument('--endpoint', choices=ENDPOINTS, default='match', help="Endpoint to load (default: match)")
+    arg_parser.add_argument('--concurrency', type=int, default=32, help="Parallel connections (default: 32)")
+    arg_parser.add_argument('--requests', type=int, default=2000, help="Measured requests (default: 2000)")
+    arg_parser.add_argument('--top-n', type=int, default=5, help="Matches per request (default: 5)")
+    arg_parser.add_argument('--json', action='store_true', help="Print the summary as JSON")
+    args = arg_parser.parse_args(argv)
+
+    summary = asyncio.run(load_test(args))
+    if args.json:
+        print(json.dumps(summary))
+    else:
+        errors = sum(summary['errors'].values())
+        print(f"{summary['requests']} {args.endpoint} requests in {summary['seconds']}s "
+              f"({errors} errors): {summary['requests_per_second']} req/s, "
+              f"p50 {summary['p50_ms']} ms, p99 {summary['p99_ms']} ms, max {summary['max_ms']} ms")
+    return 1 if summary['errors'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
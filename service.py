@@ -0,0 +1,350 @@
+"""Headless HTTP service for the parse -> analyze -> match pipeline.
+
+Runs on asyncio with a small built-in HTTP/1.1 server (keep-alive, JSON
+responses). Parsing is CPU-bound and runs in a process pool; concurrent match
+requests are collected into micro-batches and scored together with
+``JobMatcher.match_batch``, one matrix product per batch. AI analysis uses
+the async OpenAI path when OPENAI_API_KEY is set (OPENAI_BASE_URL selects
+another endpoint); otherwise /analyze returns the rule-based fallback.
+
+    python service.py --port 8080 --workers 4 --snapshot index/
+    curl --data-binary @resume.pdf http://localhost:8080/parse
+    curl --data-binary @resume.pdf 'http://localhost:8080/analyze?top_n=10'
+    curl -d @parsed.json 'http://localhost:8080/match?top_n=5'
+
+Endpoints:
+    GET  /health   job count and batching statistics
+    POST /parse    resume file bytes (PDF/DOCX) -> parsed resume
+    POST /analyze  resume file bytes -> parsed resume, AI analysis and job matches
+    POST /match    parsed resume as JSON (as returned by /parse) -> job matches
+"""
+import argparse
+import asyncio
+import json
+import os
+import signal
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from utils.ai_analyzer import DEFAULT_MAX_CONCURRENCY, AIAnalyzer, close_async_clients, fallback_analysis
+from utils.job_matcher import JobMatcher
+from utils.parse_cache import ParseCache
+from utils.resume_parser import ResumeParser
+
+DEFAULT_PORT = 8080
+# Largest request body accepted; resumes are a few hundred KB at most
+MAX_BODY_BYTES = 16 * 1024 * 1024
+# Match requests arriving within this window are scored as one batch
+DEFAULT_BATCH_WINDOW_MS = 5.0
+DEFAULT_MAX_BATCH = 64
+DEFAULT_TOP_N = 5
+MAX_TOP_N = 100
+
+_worker_parser = None
+
+
+def _init_worker(cache_path: Optional[str]):
+    """Build one parser per worker process instead of one per request"""
+    global _worker_parser
+    _worker_parser = ResumeParser(cache=ParseCache(cache_path) if cache_path else None)
+
+
+def _worker_ready() -> bool:
+    return _worker_parser is not None
+
+
+def _parse_upload(data: bytes) -> Dict:
+    """Parse an uploaded resume inside a worker process"""
+    return _worker_parser.parse_resume(data)
+
+
+class HTTPError(Exception):
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class MatchBatcher:
+    """Micro-batches concurrent match requests.
+
+    A request waits at most ``window`` seconds for others to join it, or
+    until ``max_batch`` are queued. One batch is scored at a time on a
+    dedicated thread, so requests that arrive meanwhile form the next batch;
+    under load batches grow and the per-request cost falls.
+    """
+
+    def __init__(self, matcher: JobMatcher, window: float = DEFAULT_BATCH_WINDOW_MS / 1000,
+                 max_batch: int = DEFAULT_MAX_BATCH):
+        self.matcher = matcher
+        self.window = window
+        self.max_batch = max_batch
+        self.pending: List[Tuple[Dict, int, asyncio.Future]] = []
+        self.batches = 0
+        self.requests = 0
+        # The matcher is not thread-safe; a single thread also keeps batches strictly ordered
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='match-batch')
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._running: Optional[asyncio.Task] = None
+
+    async def match(self, resume_data: Dict, top_n: int) -> List[Dict]:
+        """Top job matches for one resume, scored together with concurrent requests"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.append((resume_data, top_n, future))
+        if len(self.pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        # A running batch flushes the queue itself when it finishes
+        if self._running is not None or not self.pending:
+            return
+        batch, self.pending = self.pending[:self.max_batch], self.pending[self.max_batch:]
+        self._running = asyncio.get_running_loop().create_task(self._score(batch))
+
+    async def _score(self, batch: List[Tuple[Dict, int, asyncio.Future]]):
+        loop = asyncio.get_running_loop()
+        resumes = [resume_data for resume_data, _, _ in batch]
+        jobs_per_resume = max(top_n for _, top_n, _ in batch)
+        try:
+            result = await loop.run_in_executor(
+                self._executor, lambda: self.matcher.match_batch(resumes, jobs_per_resume=jobs_per_resume,
+                                                                 resumes_per_job=0))
+            for (_, top_n, future), matches in zip(batch, result['jobs_per_resume']):
+                if not future.done():
+                    future.set_result(matches[:top_n])
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            self.batches += 1
+            self.requests += len(batch)
+            self._running = None
+            if self.pending:
+                self._flush()
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class AnalysisService:
+    """Routes HTTP requests onto the parser pool, the AI analyzer and the match batcher"""
+
+    def __init__(self, matcher: JobMatcher, parse_pool: ProcessPoolExecutor, batcher: MatchBatcher,
+                 ai_analyzer: Optional[AIAnalyzer] = None):
+        self.matcher = matcher
+        self.parse_pool = parse_pool
+        self.batcher = batcher
+        self.ai_analyzer = ai_analyzer
+        self.started = time.time()
+
+    async def handle(self, method: str, target: str, body: bytes) -> Tuple[HTTPStatus, Dict]:
+        """Dispatch one request to its endpoint"""
+        url = urlsplit(target)
+        routes = {
+            '/health': ('GET', self.health),
+            '/parse': ('POST', self.parse),
+            '/analyze': ('POST', self.analyze),
+            '/match': ('POST', self.match)
+        }
+        if url.path not in routes:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"No endpoint {url.path}")
+        allowed, endpoint = routes[url.path]
+        if method != allowed:
+            raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, f"{url.path} only accepts {allowed}")
+        return await endpoint(parse_qs(url.query), body)
+
+    async def health(self, query: Dict, body: bytes) -> Tuple[HTTPStatus, Dict]:
+        return HTTPStatus.OK, {
+            'status': 'ok',
+            'jobs': len(self.matcher.index),
+            'uptime_seconds': round(time.time() - self.started, 1),
+            'match_requests': self.batcher.requests,
+            'match_batches': self.batcher.batches
+        }
+
+    async def parse(self, query: Dict, body: bytes) -> Tuple[HTTPStatus, Dict]:
+        resume_data = await self._parse(body)
+        return HTTPStatus.OK, resume_data
+
+    async def analyze(self, query: Dict, body: bytes) -> Tuple[HTTPStatus, Dict]:
+        resume_data = await self._parse(body)
+        matches = self.batcher.match(resume_data, _top_n(query))
+        if self.ai_analyzer is not None:
+            # The API call runs on the loop's pooled client while the resume waits for its match batch
+            analysis, matches = await asyncio.gather(self.ai_analyzer.analyze_resume_async(resume_data), matches)
+        else:
+            analysis, matches = fallback_analysis(resume_data), await matches
+        return HTTPStatus.OK, {'resume': resume_data, 'analysis': analysis, 'job_matches': matches}
+
+    async def match(self, query: Dict, body: bytes) -> Tuple[HTTPStatus, Dict]:
+        try:
+            resume_data = json.loads(body)
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Body must be a parsed resume as JSON")
+        if not isinstance(resume_data, dict):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Body must be a JSON object")
+        return HTTPStatus.OK, {'job_matches': await self.batcher.match(resume_data, _top_n(query))}
+
+    async def _parse(self, body: bytes) -> Dict:
+        if not body:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Send the resume file as the request body")
+        resume_data = await asyncio.get_running_loop().run_in_executor(self.parse_pool, _parse_upload, body)
+        if resume_data.get('error'):
+            raise HTTPError(HTTPStatus.UNPROCESSABLE_ENTITY, resume_data['error'])
+        return resume_data
+
+    async def serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve keep-alive HTTP/1.1 requests on one connection until either side closes it"""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                keep_alive = False
+                try:
+                    method, target, version = _split_request_line(request_line)
+                    headers = await _read_headers(reader)
+                    keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+                    length = _content_length(headers)
+                    if length > MAX_BODY_BYTES:
+                        # The unread body would be taken for the next request
+                        keep_alive = False
+                        raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                                        f"Body exceeds {MAX_BODY_BYTES} bytes")
+                    body = await reader.readexactly(length) if length else b''
+                    status, payload = await self.handle(method, target, body)
+                except HTTPError as e:
+                    status, payload = e.status, {'error': str(e)}
+                except asyncio.IncompleteReadError:
+                    break
+                except Exception as e:
+                    status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {'error': f"Internal error: {str(e)}"}
+
+                writer.write(_response(status, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.LimitOverrunError):
+            pass
+        finally:
+            writer.close()
+
+
+def _split_request_line(line: bytes) -> Tuple[str, str, str]:
+    parts = line.decode('latin-1').split()
+    if len(parts) != 3 or not parts[2].startswith('HTTP/'):
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Malformed request line")
+    return parts[0], parts[1], parts[2]
+
+
+def _content_length(headers: Dict[str, str]) -> int:
+    try:
+        length = int(headers.get('content-length', 0))
+    except ValueError:
+        length = -1
+    if length < 0:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length")
+    return length
+
+
+async def _read_headers(reader: asyncio.StreamReader) -> Dict[str, str]:
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            return headers
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+
+def _top_n(query: Dict) -> int:
+    try:
+        top_n = int(query.get('top_n', [DEFAULT_TOP_N])[0])
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "top_n must be an integer")
+    return max(1, min(top_n, MAX_TOP_N))
+
+
+def _response(status: HTTPStatus, payload: Dict, keep_alive: bool) -> bytes:
+    body = json.dumps(payload).encode('utf-8')
+    head = (f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+    return head.encode('latin-1') + body
+
+
+def build_matcher(jobs_path: Optional[str], snapshot_path: Optional[str]) -> JobMatcher:
+    """Job matcher from a snapshot, a job feed or the bundled sample jobs"""
+    if snapshot_path:
+        return JobMatcher.from_snapshot(snapshot_path)
+    if jobs_path:
+        return JobMatcher.from_feed(jobs_path)
+    return JobMatcher()
+
+
+async def serve(args) -> int:
+    """Start the service and run until interrupted"""
+    matcher = build_matcher(args.jobs, args.snapshot)
+    api_key = os.environ.get('OPENAI_API_KEY')
+    ai_analyzer = AIAnalyzer(api_key, max_concurrency=args.ai_concurrency) if api_key else None
+    batcher = MatchBatcher(matcher, window=args.batch_window_ms / 1000, max_batch=args.max_batch)
+
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    # Stop on SIGTERM as on Ctrl-C, so the parser pool is shut down rather than orphaned
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+
+    with ProcessPoolExecutor(max_workers=args.workers or os.cpu_count() or 1, initializer=_init_worker,
+                             initargs=(args.cache,)) as parse_pool:
+        # The first task forks every worker; doing it before binding keeps the listening socket out of them
+        await loop.run_in_executor(parse_pool, _worker_ready)
+        service = AnalysisService(matcher, parse_pool, batcher, ai_analyzer)
+        server = await asyncio.start_server(service.serve_connection, args.host, args.port)
+        print(f"Serving {len(matcher.index)} jobs on http://{args.host}:{args.port} "
+              f"(AI analysis {'on' if ai_analyzer else 'off, using fallback'})", flush=True)
+        try:
+            async with server:
+                await stop.wait()
+        finally:
+            batcher.close()
+            await close_async_clients()
+    return 0
+
+
+def main(argv=None) -> int:
+    """Command-line entry point"""
+    arg_parser = argparse.ArgumentParser(description="Serve resume parsing, analysis and job matching over HTTP")
+    arg_parser.add_argument('--host', default='127.0.0.1', help="Interface to bind (default: 127.0.0.1)")
+    arg_parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT})")
+    arg_parser.add_argument('--workers', type=int, default=None, help="Parser processes (default: CPU count)")
+    arg_parser.add_argument('--cache', default=None, help="Optional shared parse cache file")
+    jobs = arg_parser.add_mutually_exclusive_group()
+    jobs.add_argument('--jobs', default=None, help="JSON or JSONL job feed (default: sample jobs)")
+    jobs.add_argument('--snapshot', default=None, help="Saved job index snapshot directory")
+    arg_parser.add_argument('--batch-window-ms', type=float, default=DEFAULT_BATCH_WINDOW_MS,
+                            help=f"How long a match request waits for others to batch with "
+                                 f"(default: {DEFAULT_BATCH_WINDOW_MS})")
+    arg_parser.add_argument('--max-batch', type=int, default=DEFAULT_MAX_BATCH,
+                            help=f"Most match requests scored together (default: {DEFAULT_MAX_BATCH})")
+    arg_parser.add_argument('--ai-concurrency', type=int, default=DEFAULT_MAX_CONCURRENCY,
+                            help=f"OpenAI calls in flight at once (default: {DEFAULT_MAX_CONCURRENCY})")
+    args = arg_parser.parse_args(argv)
+
+    return asyncio.run(serve(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
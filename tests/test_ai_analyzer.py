@@ -0,0 +1,98 @@
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip('openai')
+
+from utils import ai_analyzer
+from utils.ai_analyzer import AIAnalyzer
+
+RATE_LIMITED_CALLS = 2
+MAX_CONCURRENCY = 3
+RESUME_COUNT = 12
+
+
+class StubCompletions(BaseHTTPRequestHandler):
+    """OpenAI-compatible chat completions endpoint: 429 for the first calls, then 200.
+
+    Each answer echoes the resume number found in the prompt as its
+    ``overall_score``, so callers can check which request it belongs to.
+    """
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        stub = self.server
+        request = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        with stub.lock:
+            stub.calls += 1
+            limited = stub.rate_limited < RATE_LIMITED_CALLS
+            if limited:
+                stub.rate_limited += 1
+            else:
+                stub.in_flight += 1
+                stub.peak = max(stub.peak, stub.in_flight)
+
+        if limited:
+            self._reply(429, {'error': {'message': "Rate limit reached", 'type': 'rate_limit_exceeded'}},
+                        {'Retry-After': '0'})
+            return
+        # Hold the call open long enough for concurrent requests to overlap
+        time.sleep(0.05)
+        with stub.lock:
+            stub.in_flight -= 1
+        resume_number = int(re.search(r'resume-(\d+)', request['messages'][-1]['content']).group(1))
+        content = json.dumps({'overall_score': resume_number, 'strengths': ["stub"]})
+        self._reply(200, {
+            'id': 'chatcmpl-stub',
+            'object': 'chat.completion',
+            'created': 0,
+            'model': request['model'],
+            'choices': [{'index': 0, 'finish_reason': 'stop',
+                         'message': {'role': 'assistant', 'content': content}}],
+            'usage': {'prompt_tokens': 1, 'completion_tokens': 1, 'total_tokens': 2}
+        })
+
+    def _reply(self, status: int, payload: dict, headers: dict = None):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubCompletions)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.calls = server.rate_limited = server.in_flight = server.peak = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_analyze_many_retries_rate_limits_within_concurrency_cap(stub_server, monkeypatch):
+    monkeypatch.setattr(ai_analyzer, 'BACKOFF_BASE', 0.01)
+    analyzer = AIAnalyzer('test-key', base_url=f"http://127.0.0.1:{stub_server.server_port}/v1",
+                          max_concurrency=MAX_CONCURRENCY, timeout=5.0)
+    resumes = [{'raw_text': f"resume-{number}", 'skills': {}} for number in range(RESUME_COUNT)]
+
+    results = analyzer.analyze_many(resumes)
+
+    # Every 429 was retried rather than answered with the fallback analysis
+    assert stub_server.rate_limited == RATE_LIMITED_CALLS
+    assert stub_server.calls == RESUME_COUNT + RATE_LIMITED_CALLS
+    assert stub_server.peak <= MAX_CONCURRENCY
+    assert [result['overall_score'] for result in results] == list(range(RESUME_COUNT))
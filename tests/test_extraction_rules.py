@@ -0,0 +1,40 @@
+from utils.resume_parser import ResumeParser
+
+SAMPLE_RESUME = """Jane Doe
+jane.doe@example.com | +1 (555) 123-4567 | linkedin.com/in/janedoe
+
+SUMMARY
+Backend engineer working with Python and PostgreSQL.
+
+EXPERIENCE
+Senior Engineer at Acme Corp 2019 - Present
+Engineer, Globex Inc 2015 - 2019
+
+EDUCATION
+BSc Computer Science, State University
+"""
+
+
+def test_analyze_text_scans_rules_once():
+    parser = ResumeParser()
+    result = parser.analyze_text(SAMPLE_RESUME)
+
+    assert parser.rules.scan_count == 1
+
+    personal_info = result['personal_info']
+    assert personal_info['email'] == 'jane.doe@example.com'
+    assert personal_info['phone'] is not None
+    assert personal_info['linkedin'] == 'linkedin.com/in/janedoe'
+
+    assert {'SUMMARY', 'EXPERIENCE', 'EDUCATION'} <= set(result['sections'])
+    assert 'Acme Corp' in result['sections']['EXPERIENCE']
+
+    assert [entry['duration'] for entry in result['experience']] == ['2019 - Present', '2015 - 2019']
+
+
+def test_each_document_is_scanned_once():
+    parser = ResumeParser()
+    for _ in range(3):
+        parser.analyze_text(SAMPLE_RESUME)
+
+    assert parser.rules.scan_count == 3
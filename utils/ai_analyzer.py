@@ -1,11 +1,115 @@
-import openai
-from typing import Dict, List
+from typing import Dict, Iterable, List, Optional
+import asyncio
 import json
+import random
 import re
+import threading
+import time
+import weakref
+
+DEFAULT_MODEL = "gpt-3.5-turbo"
+# API calls in flight at once per analyzer and event loop
+DEFAULT_MAX_CONCURRENCY = 8
+# Seconds allowed for one completion call
+DEFAULT_TIMEOUT = 60.0
+# Attempts after the first on rate limits, timeouts and server errors
+DEFAULT_MAX_RETRIES = 4
+# Exponential backoff: the delay ceiling starts at BACKOFF_BASE seconds and doubles up to BACKOFF_CAP
+BACKOFF_BASE = 1.0
+BACKOFF_CAP = 30.0
+
+# Clients are pooled per process: one per API key and endpoint, reused by every analyzer
+_clients: Dict = {}
+# Async clients hold connections bound to one event loop, so they are pooled per loop
+_async_clients: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_clients_lock = threading.Lock()
+
+
+def get_client(api_key: str, base_url: Optional[str] = None):
+    """Shared synchronous OpenAI client for a key and endpoint"""
+    with _clients_lock:
+        client = _clients.get((api_key, base_url))
+        if client is None:
+            import openai  # Heavy; only loaded once a client is actually needed
+            # Retries are done by the analyzer, with jitter, so the SDK's own are off
+            client = openai.OpenAI(api_key=api_key, base_url=base_url, max_retries=0)
+            _clients[api_key, base_url] = client
+    return client
+
+
+def get_async_client(api_key: str, base_url: Optional[str] = None):
+    """Shared async OpenAI client for a key and endpoint on the running event loop"""
+    clients = _async_clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get((api_key, base_url))
+    if client is None:
+        import openai
+        client = openai.AsyncOpenAI(api_key=api_key, base_url=base_url, max_retries=0)
+        clients[api_key, base_url] = client
+    return client
+
+
+async def close_async_clients():
+    """Close the pooled async clients of the running event loop before it shuts down"""
+    clients = _async_clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.close()
+
+
+def backoff_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """Full-jitter exponential backoff, never shorter than the server's Retry-After"""
+    delay = random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+    return max(delay, retry_after or 0.0)
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    response = getattr(error, 'response', None)
+    try:
+        return float(response.headers.get('retry-after'))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Rate limits, timeouts, dropped connections and 5xx responses are worth another attempt"""
+    import openai
+    return isinstance(error, (openai.RateLimitError, openai.APITimeoutError, openai.APIConnectionError,
+                              openai.InternalServerError))
+
+
+def fallback_analysis(resume_data: Dict) -> Dict:
+    """Rule-based analysis used when no API key is set or the AI call fails"""
+    skills = resume_data.get('skills', {})
+    tech_skills_count = sum(len(skills_list) for skills_list in skills.values())
+    
+    return {
+        "overall_score": min(80, tech_skills_count * 5 + 40),
+        "strengths": ["Technical proficiency", "Industry experience"],
+        "weaknesses": ["Limited detail in achievements", "Could improve formatting"],
+        "skill_gaps": ["Advanced certifications", "Specialized tools"],
+        "improvement_suggestions": [
+            "Quantify achievements with numbers",
+            "Add more project details",
+            "Include relevant certifications"
+        ],
+        "career_recommendations": ["Technical roles", "Engineering positions"],
+        "ats_optimization_score": 70,
+        "key_achievements": ["Demonstrated technical capabilities", "Project experience"]
+    }
+
 
 class AIAnalyzer:
-    def __init__(self, api_key: str):
-        self.client = openai.OpenAI(api_key=api_key)
+    def __init__(self, api_key: str, base_url: Optional[str] = None, model: str = DEFAULT_MODEL,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY, timeout: float = DEFAULT_TIMEOUT,
+                 max_retries: int = DEFAULT_MAX_RETRIES):
+        # base_url points the analyzer at any OpenAI-compatible endpoint, such as a local stub server
+        self.api_key = api_key
+        self.base_url = base_url
+        self.model = model
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.client = get_client(api_key, base_url)
+        self._semaphores: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
         
     def analyze_resume(self, resume_data: Dict) -> Dict:
         """Comprehensive AI analysis of resume"""
@@ -16,6 +120,28 @@ class AIAnalyzer:
         except Exception as e:
             return self._get_fallback_analysis(resume_data)
 
+    async def analyze_resume_async(self, resume_data: Dict) -> Dict:
+        """AI analysis of a resume without blocking the event loop"""
+        try:
+            analysis_prompt = self._create_analysis_prompt(resume_data)
+            response = await self._get_ai_response_async(analysis_prompt)
+            return self._parse_ai_response(response)
+        except Exception as e:
+            return self._get_fallback_analysis(resume_data)
+
+    async def analyze_many_async(self, resumes: Iterable[Dict]) -> List[Dict]:
+        """Analyse many resumes concurrently, at most ``max_concurrency`` API calls at a time"""
+        return list(await asyncio.gather(*(self.analyze_resume_async(resume_data) for resume_data in resumes)))
+
+    def analyze_many(self, resumes: Iterable[Dict]) -> List[Dict]:
+        """Batch analysis for synchronous callers; results are in input order"""
+        async def run():
+            try:
+                return await self.analyze_many_async(resumes)
+            finally:
+                await close_async_clients()
+        return asyncio.run(run())
+
     def _create_analysis_prompt(self, resume_data: Dict) -> str:
         """Create detailed prompt for AI analysis"""
         return f"""
@@ -44,18 +170,50 @@ class AIAnalyzer:
         Be specific, constructive, and data-driven in your analysis.
         """
 
-    def _get_ai_response(self, prompt: str) -> str:
-        """Get response from OpenAI API"""
-        response = self.client.chat.completions.create(
-            model="gpt-3.5-turbo",
+    def _completion_request(self, prompt: str) -> Dict:
+        return dict(
+            model=self.model,
             messages=[
                 {"role": "system", "content": "You are an expert resume analyst and career coach. Provide detailed, constructive feedback."},
                 {"role": "user", "content": prompt}
             ],
             temperature=0.3,
-            max_tokens=1500
+            max_tokens=1500,
+            timeout=self.timeout
         )
-        return response.choices[0].message.content
+
+    def _get_ai_response(self, prompt: str) -> str:
+        """Get response from OpenAI API"""
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self.client.chat.completions.create(**self._completion_request(prompt))
+                return response.choices[0].message.content
+            except Exception as e:
+                if attempt == self.max_retries or not _is_retryable(e):
+                    raise
+                time.sleep(backoff_delay(attempt, _retry_after(e)))
+
+    async def _get_ai_response_async(self, prompt: str) -> str:
+        """Get response from OpenAI API through the loop's pooled async client"""
+        client = get_async_client(self.api_key, self.base_url)
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with self._semaphore():
+                    response = await client.chat.completions.create(**self._completion_request(prompt))
+                return response.choices[0].message.content
+            except Exception as e:
+                if attempt == self.max_retries or not _is_retryable(e):
+                    raise
+                # Back off outside the semaphore so waiting calls do not hold a slot
+                await asyncio.sleep(backoff_delay(attempt, _retry_after(e)))
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        """Concurrency limit for the running event loop"""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
 
     def _parse_ai_response(self, response: str) -> Dict:
         """Parse AI response into structured data"""
@@ -84,23 +242,7 @@ class AIAnalyzer:
 
     def _get_fallback_analysis(self, resume_data: Dict) -> Dict:
         """Provide fallback analysis when AI fails"""
-        skills = resume_data.get('skills', {})
-        tech_skills_count = sum(len(skills_list) for skills_list in skills.values())
-        
-        return {
-            "overall_score": min(80, tech_skills_count * 5 + 40),
-            "strengths": ["Technical proficiency", "Industry experience"],
-            "weaknesses": ["Limited detail in achievements", "Could improve formatting"],
-            "skill_gaps": ["Advanced certifications", "Specialized tools"],
-            "improvement_suggestions": [
-                "Quantify achievements with numbers",
-                "Add more project details",
-                "Include relevant certifications"
-            ],
-            "career_recommendations": ["Technical roles", "Engineering positions"],
-            "ats_optimization_score": 70,
-            "key_achievements": ["Demonstrated technical capabilities", "Project experience"]
-        }
+        return fallback_analysis(resume_data)
 
     def _get_default_analysis(self) -> Dict:
         """Default analysis template"""
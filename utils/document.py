@@ -0,0 +1,55 @@
+import re
+from bisect import bisect_right
+from typing import List
+
+from utils.tokens import TokenStream
+
+_INLINE_WHITESPACE = re.compile(r'[^\S\n]+')
+
+
+class ResumeDocument:
+    """Line-structured view of a resume built once and shared by all extractors.
+
+    Whitespace is collapsed inside each line but line breaks are kept, so
+    line-oriented extractors (sections, experience, education) keep working.
+    """
+
+    def __init__(self, text: str):
+        lines = []
+        for raw_line in text.replace('\r\n', '\n').replace('\r', '\n').split('\n'):
+            line = _INLINE_WHITESPACE.sub(' ', raw_line).strip()
+            if line:
+                lines.append(line)
+
+        self.lines: List[str] = lines
+        self.text = '\n'.join(lines)
+        self.text_lower = self.text.lower()
+        self.lines_lower: List[str] = self.text_lower.split('\n') if lines else []
+
+        # Start offset of every line inside ``text``
+        self.offsets: List[int] = []
+        offset = 0
+        for line in lines:
+            self.offsets.append(offset)
+            offset += len(line) + 1
+
+        # Rule matches, filled in by the parser's single rule-table scan
+        self.matches = None
+        self._tokens = None
+
+    def __len__(self) -> int:
+        return len(self.lines)
+
+    def __bool__(self) -> bool:
+        return bool(self.lines)
+
+    @property
+    def tokens(self) -> TokenStream:
+        """Word tokens of the whole text, built on first use"""
+        if self._tokens is None:
+            self._tokens = TokenStream.from_text(self.text)
+        return self._tokens
+
+    def line_at(self, offset: int) -> int:
+        """Return the index of the line containing a character offset"""
+        return bisect_right(self.offsets, offset) - 1
@@ -0,0 +1,103 @@
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+from typing import BinaryIO, Iterator, List, Union
+
+W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+MC_FALLBACK = '{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback'
+
+PARAGRAPH = W_NS + 'p'
+TABLE_ROW = W_NS + 'tr'
+TABLE_CELL = W_NS + 'tc'
+TEXT = W_NS + 't'
+TAB = W_NS + 'tab'
+BREAKS = (W_NS + 'br', W_NS + 'cr')
+BODY = W_NS + 'body'
+
+HEADER_PART = re.compile(r'^word/header(\d*)\.xml$')
+FOOTER_PART = re.compile(r'^word/footer(\d*)\.xml$')
+
+
+def _numbered_parts(names: List[str], pattern: re.Pattern) -> List[str]:
+    """Header/footer parts sorted by their number"""
+    matches = [(pattern.match(name), name) for name in names]
+    return [name for match, name in sorted(
+        ((match, name) for match, name in matches if match),
+        key=lambda item: int(item[0].group(1) or 0)
+    )]
+
+
+def iter_part_blocks(stream: BinaryIO) -> Iterator[str]:
+    """Yield paragraph and table-row text of one WordprocessingML part in order.
+
+    Paragraphs inside table cells are joined per cell and cells per row.
+    Text boxes are emitted as their own blocks; the ``mc:Fallback`` copy of
+    alternate content is skipped so text boxes are not duplicated.
+    """
+    # Open paragraphs, rows and cells as [tag, parts] pairs
+    containers = []
+    fallback_depth = 0
+    body = None
+
+    for event, elem in ET.iterparse(stream, events=('start', 'end')):
+        tag = elem.tag
+        if tag == MC_FALLBACK:
+            fallback_depth += 1 if event == 'start' else -1
+            continue
+        if fallback_depth:
+            if event == 'end':
+                elem.clear()
+            continue
+
+        if event == 'start':
+            if tag in (PARAGRAPH, TABLE_ROW, TABLE_CELL):
+                containers.append([tag, []])
+            elif tag == BODY:
+                body = elem
+            continue
+
+        block = None
+        if tag == TEXT:
+            if containers and elem.text:
+                containers[-1][1].append(elem.text)
+        elif tag == TAB:
+            if containers:
+                containers[-1][1].append('\t')
+        elif tag in BREAKS:
+            if containers:
+                containers[-1][1].append('\n')
+        elif tag == PARAGRAPH:
+            block = ''.join(containers.pop()[1]).strip()
+        elif tag == TABLE_CELL:
+            cell = ' '.join(part for part in containers.pop()[1] if part)
+            if containers and containers[-1][0] == TABLE_ROW:
+                containers[-1][1].append(cell)
+        elif tag == TABLE_ROW:
+            block = ' | '.join(cell for cell in containers.pop()[1] if cell)
+
+        if block:
+            # Content of a cell stays in the cell; anything else is a block
+            if containers and containers[-1][0] == TABLE_CELL:
+                containers[-1][1].append(block)
+            else:
+                yield block
+
+        elem.clear()
+        if body is not None and not containers:
+            # Finished top-level blocks are no longer needed
+            body.clear()
+
+
+def iter_docx_blocks(source: Union[str, BinaryIO]) -> Iterator[str]:
+    """Yield text blocks from headers, the document body and footers"""
+    with zipfile.ZipFile(source) as archive:
+        names = archive.namelist()
+        parts = _numbered_parts(names, HEADER_PART) + ['word/document.xml'] + _numbered_parts(names, FOOTER_PART)
+        for part in parts:
+            with archive.open(part) as stream:
+                yield from iter_part_blocks(stream)
+
+
+def extract_docx_text(source: Union[str, BinaryIO]) -> str:
+    """Extract DOCX text straight from the zip, one block per line"""
+    return '\n'.join(iter_docx_blocks(source))
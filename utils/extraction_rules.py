@@ -0,0 +1,60 @@
+import json
+import os
+import re
+from typing import Dict, List, Optional
+
+DEFAULT_RULES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                  'templates', 'extraction_rules.json')
+RULE_FLAGS = re.IGNORECASE | re.MULTILINE
+
+
+class RuleEngine:
+    """Declarative extraction rules compiled into one named-group pattern.
+
+    Each rule is ``{"name": ..., "pattern": ..., "target": ...}``. All rules
+    are joined into a single alternation so one ``finditer`` pass over a resume
+    yields the matches for every rule. New rules only need an entry in the
+    rules file.
+    """
+
+    def __init__(self, rules: List[Dict]):
+        self.rules = []
+        self.patterns: Dict[str, re.Pattern] = {}
+        for rule in rules:
+            name = rule['name']
+            if not name.isidentifier() or name in self.patterns:
+                raise ValueError(f"Invalid or duplicate rule name: {name!r}")
+            self.patterns[name] = re.compile(rule['pattern'], RULE_FLAGS)
+            self.rules.append(rule)
+
+        self.master_pattern = re.compile(
+            '|'.join(f"(?P<{rule['name']}>{rule['pattern']})" for rule in self.rules),
+            RULE_FLAGS
+        )
+        self.scan_count = 0
+
+    @classmethod
+    def from_file(cls, path: Optional[str] = None) -> 'RuleEngine':
+        """Load rules from a JSON rules file"""
+        with open(path or DEFAULT_RULES_PATH, encoding='utf-8') as rules_file:
+            return cls(json.load(rules_file)['rules'])
+
+    def names_for_target(self, target: str) -> List[str]:
+        """Names of the rules feeding a given output field"""
+        return [rule['name'] for rule in self.rules if rule.get('target') == target]
+
+    def scan(self, text: str) -> Dict[str, List[re.Match]]:
+        """Run the master pattern once and group matches by rule name"""
+        self.scan_count += 1
+        matches = {name: [] for name in self.patterns}
+        for match in self.master_pattern.finditer(text):
+            matches[match.lastgroup].append(match)
+        return matches
+
+    def match(self, name: str, text: str) -> Optional[re.Match]:
+        """Match a single rule at the start of a string"""
+        return self.patterns[name].match(text)
+
+    def search(self, name: str, text: str) -> Optional[re.Match]:
+        """Search a single rule anywhere in a string"""
+        return self.patterns[name].search(text)
@@ -0,0 +1,75 @@
+import json
+import os
+from typing import Dict, Iterator
+
+SAMPLE_JOBS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                'templates', 'sample_jobs.json')
+READ_CHUNK_SIZE = 64 * 1024
+
+
+def _iter_json_array(handle, buffer: str) -> Iterator[Dict]:
+    """Decode the objects of a top-level JSON array one at a time"""
+    decoder = json.JSONDecoder()
+    position = buffer.index('[') + 1
+    eof = False
+
+    while True:
+        # Skip separators between elements
+        while position < len(buffer) and buffer[position] in ' \t\r\n,':
+            position += 1
+        if position < len(buffer) and buffer[position] == ']':
+            return
+        if position >= len(buffer):
+            if eof:
+                raise ValueError("Unterminated JSON array in job feed")
+            chunk = handle.read(READ_CHUNK_SIZE)
+            eof = not chunk
+            buffer = buffer[position:] + chunk
+            position = 0
+            continue
+
+        try:
+            job, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            # The element straddles the chunk boundary; read more and retry
+            chunk = handle.read(READ_CHUNK_SIZE)
+            if not chunk:
+                raise
+            buffer = buffer[position:] + chunk
+            position = 0
+            continue
+        yield job
+        position = end
+        if position > READ_CHUNK_SIZE:
+            buffer = buffer[position:]
+            position = 0
+
+
+def iter_jobs(path: str) -> Iterator[Dict]:
+    """Stream job postings from a JSON array or JSONL file without loading it whole"""
+    with open(path, encoding='utf-8') as handle:
+        buffer = ''
+        while True:
+            chunk = handle.read(READ_CHUNK_SIZE)
+            if not chunk:
+                return
+            buffer += chunk
+            stripped = buffer.lstrip()
+            if stripped:
+                break
+
+        if stripped[0] == '[':
+            yield from _iter_json_array(handle, buffer)
+            return
+
+        # JSONL: one posting per line
+        pending = buffer
+        for chunk in iter(lambda: handle.read(READ_CHUNK_SIZE), ''):
+            pending += chunk
+            lines = pending.split('\n')
+            pending = lines.pop()
+            for line in lines:
+                if line.strip():
+                    yield json.loads(line)
+        if pending.strip():
+            yield json.loads(pending)
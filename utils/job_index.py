@@ -0,0 +1,740 @@
+import json
+import mmap
+import os
+import shutil
+import tempfile
+import time
+from collections.abc import Mapping
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import scipy.sparse as sp
+
+from utils.skill_bits import SkillVocabulary, pack_rows, popcount_rows
+from utils.tokens import TokenStream
+
+# Rebuild the matrix once this share of its rows belongs to expired postings
+COMPACT_RATIO = 0.25
+# Rows appended since the term -> rows inverted index was built sit in a small
+# side index until they make up this share of all rows
+POSTINGS_TAIL_RATIO = 0.1
+# The hashing index refreshes its IDF, and so every row norm, once the postings
+# added or expired since the last refresh exceed this share of the live ones
+REWEIGHT_RATIO = 0.01
+DEFAULT_HASH_FEATURES = 2 ** 20
+# Bump when the snapshot layout changes; older snapshots are then refused, not misread
+SNAPSHOT_VERSION = 2
+MANIFEST_FILE = 'manifest.json'
+# Each save writes a new ``<path>.snapshot-*`` directory and ``path`` becomes a
+# symlink to it; superseded ones are removed after this many seconds, so
+# replicas still loading them are not cut off
+SNAPSHOT_DIR_INFIX = '.snapshot-'
+SNAPSHOT_GRACE_SECONDS = 60
+JOBS_FILE = 'jobs.jsonl'
+JOB_IDS_FILE = 'job_ids.json'
+
+
+class SnapshotJob(Mapping):
+    """A posting from a snapshot, decoded from the mapped jobs file on first access.
+
+    Loading a snapshot only records where each posting's JSON line sits, so
+    start-up cost does not grow with the size of the job metadata.
+    """
+    __slots__ = ('_buffer', '_start', '_end', '_job')
+
+    def __init__(self, buffer, start: int, end: int):
+        self._buffer = buffer
+        self._start = start
+        self._end = end
+        self._job = None
+
+    @property
+    def raw(self) -> bytes:
+        """The posting's JSON encoding, without the newline"""
+        return self._buffer[self._start:self._end]
+
+    def _decoded(self) -> Dict:
+        if self._job is None:
+            self._job = json.loads(self.raw)
+        return self._job
+
+    def __getitem__(self, key):
+        return self._decoded()[key]
+
+    def __iter__(self) -> Iterator:
+        return iter(self._decoded())
+
+    def __len__(self) -> int:
+        return len(self._decoded())
+
+
+class RowBuffer:
+    """Append-only CSR rows kept in arrays with spare capacity.
+
+    Appending a block copies only that block (amortised), and ``matrix`` is a
+    view over the filled part, so new postings never restack the corpus.
+    Arrays taken over from a snapshot stay memory-mapped until the first
+    append.
+    """
+
+    def __init__(self, matrix: sp.csr_matrix):
+        self.n_rows, self.n_features = matrix.shape
+        self.nnz = matrix.nnz
+        self.data, self.indices, self.indptr = matrix.data, matrix.indices, matrix.indptr
+        self._matrix = matrix
+        self._owned = False
+
+    @property
+    def matrix(self) -> sp.csr_matrix:
+        if self._matrix is None:
+            self._matrix = sp.csr_matrix((self.data[:self.nnz], self.indices[:self.nnz],
+                                          self.indptr[:self.n_rows + 1]), shape=(self.n_rows, self.n_features))
+        return self._matrix
+
+    def row_indices(self, row: int) -> np.ndarray:
+        """Column indices of one stored row, read without building the matrix"""
+        return self.indices[self.indptr[row]:self.indptr[row + 1]]
+
+    def append(self, block: sp.csr_matrix):
+        nnz, n_rows = self.nnz + block.nnz, self.n_rows + block.shape[0]
+        index_dtype = np.result_type(self.indices, block.indices)
+        if nnz > np.iinfo(index_dtype).max:
+            index_dtype = np.int64
+        data_dtype = np.result_type(self.data, block.data)
+        if (not self._owned or nnz > len(self.data) or n_rows >= len(self.indptr)
+                or index_dtype != self.indices.dtype or data_dtype != self.data.dtype):
+            self._reserve(2 * nnz, 2 * (n_rows + 1), index_dtype, data_dtype)
+        # Readers holding an older view only see the filled prefix, which is never rewritten
+        self.data[self.nnz:nnz] = block.data
+        self.indices[self.nnz:nnz] = block.indices
+        self.indptr[self.n_rows + 1:n_rows + 1] = block.indptr[1:] + self.nnz
+        self.nnz, self.n_rows = nnz, n_rows
+        self._matrix = None
+
+    def _reserve(self, nnz_capacity: int, row_capacity: int, index_dtype, data_dtype):
+        data = np.empty(max(nnz_capacity, 1024), dtype=data_dtype)
+        indices = np.empty(len(data), dtype=index_dtype)
+        indptr = np.empty(max(row_capacity, 64), dtype=index_dtype)
+        data[:self.nnz] = self.data[:self.nnz]
+        indices[:self.nnz] = self.indices[:self.nnz]
+        indptr[:self.n_rows + 1] = self.indptr[:self.n_rows + 1]
+        self.data, self.indices, self.indptr = data, indices, indptr
+        self._owned = True
+
+
+def _publish_snapshot(path: str, snapshot_dir: str):
+    """Point the ``path`` symlink at a finished snapshot directory with one atomic rename"""
+    link = snapshot_dir + '.link'
+    os.symlink(os.path.basename(snapshot_dir), link)
+    if os.path.isdir(path) and not os.path.islink(path):
+        # Written before snapshots were versioned: moved aside once, then removed like any old version
+        os.rename(path, snapshot_dir + '-legacy')
+    os.replace(link, path)
+
+    parent, name = os.path.split(path)
+    current = os.path.realpath(path)
+    finished = []
+    for entry in os.scandir(parent):
+        manifest = os.path.join(entry.path, MANIFEST_FILE)
+        # Directories still being written by another save have no manifest yet
+        if (entry.name.startswith(name + SNAPSHOT_DIR_INFIX) and entry.is_dir(follow_symlinks=False)
+                and os.path.exists(manifest)):
+            finished.append((os.path.getmtime(manifest), entry.path))
+    finished.sort(reverse=True)
+    # A version was superseded when the next newer one was written
+    for (superseded, _), (_, old) in zip(finished, finished[1:]):
+        if time.time() - superseded > SNAPSHOT_GRACE_SECONDS and os.path.realpath(old) != current:
+            shutil.rmtree(old, ignore_errors=True)
+
+
+def _ids_to_rows(job_ids: Iterable) -> Dict:
+    """Row lookup for postings that have an id; id-less postings are not addressable"""
+    return {job_id: row for row, job_id in enumerate(job_ids) if job_id is not None}
+
+
+def skill_indicator(skill_rows: List[np.ndarray], n_skills: int) -> sp.csr_matrix:
+    """Sparse 0/1 matrix with one row per skill id array"""
+    indptr = np.concatenate([[0], np.cumsum([len(ids) for ids in skill_rows])]).astype(np.int64)
+    indices = np.concatenate(skill_rows) if skill_rows else np.empty(0, dtype=np.int64)
+    return sp.csr_matrix((np.ones(len(indices)), indices, indptr), shape=(len(skill_rows), n_skills))
+
+
+_stop_words = None
+
+
+def _english_stop_words() -> frozenset:
+    # sklearn dominates the package's import time, so it is only imported once an index is built
+    global _stop_words
+    if _stop_words is None:
+        from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+        _stop_words = ENGLISH_STOP_WORDS
+    return _stop_words
+
+
+def analyze_document(document: str) -> List[str]:
+    """Vectorizer analyzer for job descriptions"""
+    return TokenStream.from_text(document).terms(_english_stop_words())
+
+
+class JobIndex:
+    """Row bookkeeping shared by the job indexes.
+
+    Row ``i`` of ``matrix`` is the vector of ``jobs[i]``. Expired postings
+    leave a ``None`` tombstone until enough accumulate to compact the matrix.
+    New postings are appended to a ``RowBuffer``, and the active mask and the
+    inverted index are extended rather than rebuilt, so single-posting
+    updates never rebuild the whole index.
+    """
+
+    def __init__(self):
+        self.jobs: List[Optional[Dict]] = []
+        self.row_by_id: Dict = {}
+        self._rows: Optional[RowBuffer] = None
+        self._active = None
+        # Inverted index of the first ``_csc_rows`` rows, plus one of the rows appended since
+        self._csc = None
+        self._csc_rows = 0
+        self._tail_csc = None
+        self._expired = 0
+        # Bumped whenever rows are renumbered, so row-aligned side tables can resync
+        self.generation = 0
+        # Inverted index of required skills to rows, for candidate generation
+        self.skill_postings: Dict[str, List[int]] = {}
+        # Required skills as vocabulary ids per row, packed lazily into a bit matrix
+        self.skill_vocab = SkillVocabulary()
+        self._skill_rows: List[np.ndarray] = []
+        self._required_counts: List[int] = []
+        self._skill_bits = None
+
+    def __len__(self) -> int:
+        return len(self.jobs) - self._expired
+
+    @property
+    def matrix(self) -> sp.csr_matrix:
+        return self._rows.matrix
+
+    @property
+    def active(self) -> np.ndarray:
+        """Boolean mask of rows holding a live posting"""
+        n_rows = len(self.jobs)
+        known = 0 if self._active is None else len(self._active)
+        if known < n_rows:
+            # Only rows appended since the mask was last extended are looked at
+            tail = np.fromiter((job is not None for job in self.jobs[known:]), dtype=bool, count=n_rows - known)
+            self._active = tail if self._active is None else np.concatenate([self._active, tail])
+        return self._active
+
+    def add_jobs(self, jobs: Iterable[Dict]):
+        """Append postings; an id already in the index is updated instead"""
+        jobs = list(jobs)
+        for job in jobs:
+            # Postings without an id are always new rows and are never looked up
+            if job.get('id') is not None and job['id'] in self.row_by_id:
+                self.expire_job(job['id'])
+        if not jobs:
+            return
+        self._rows.append(self._vectorize_jobs(jobs))
+        for job in jobs:
+            row = len(self.jobs)
+            if job.get('id') is not None:
+                self.row_by_id[job['id']] = row
+            self.jobs.append(job)
+            self._index_skills(job, row)
+
+    def _index_skills(self, job: Dict, row: int):
+        required_skills = job.get('required_skills', [])
+        ids = self.skill_vocab.encode(required_skills, add=True)
+        for skill_id in ids:
+            self.skill_postings.setdefault(self.skill_vocab.names[skill_id], []).append(row)
+        self._skill_rows.append(ids)
+        # The match ratio is over the listed skills, duplicates included
+        self._required_counts.append(len(required_skills))
+
+    @property
+    def skill_bits(self) -> np.ndarray:
+        """Packed (rows, bytes) matrix of required skills; row order matches ``jobs``"""
+        n_bytes = self.skill_vocab.n_bytes
+        bits = self._skill_bits
+        packed_rows = 0 if bits is None else bits.shape[0]
+        if bits is None or packed_rows < len(self._skill_rows) or bits.shape[1] < n_bytes:
+            new_bits = pack_rows(self._skill_rows[packed_rows:], n_bytes)
+            if bits is None:
+                bits = new_bits
+            else:
+                # The vocabulary only grows, so older rows just gain zero columns
+                bits = np.pad(bits, ((0, 0), (0, n_bytes - bits.shape[1])))
+                bits = np.vstack([bits, new_bits])
+            self._skill_bits = bits
+        return bits
+
+    def skill_bitset(self, skills: Iterable[str]) -> np.ndarray:
+        """Pack a resume's skills against the job vocabulary; unknown skills match no job"""
+        return self.skill_vocab.pack(self.skill_vocab.encode(skills))
+
+    def skill_match(self, resume_bits: np.ndarray, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Share of each row's required skills present in the resume bitset"""
+        # Only the bytes where the resume has a skill can contribute matches
+        columns = np.flatnonzero(resume_bits)
+        bits = self.skill_bits[:, columns] if rows is None else self.skill_bits[np.ix_(rows, columns)]
+        matching = popcount_rows(bits & resume_bits[columns])
+        required = self.required_counts if rows is None else self.required_counts[rows]
+        return np.divide(matching, required, out=np.zeros(len(matching)), where=required > 0)
+
+    @property
+    def required_counts(self) -> np.ndarray:
+        """Number of listed required skills per row, the denominator of the skill match"""
+        return np.asarray(self._required_counts, dtype=np.int64)
+
+    def skill_indicator(self, rows: Optional[slice] = None) -> sp.csr_matrix:
+        """Sparse (rows, vocabulary) 0/1 matrix of required skills, for batch products"""
+        return skill_indicator(self._skill_rows if rows is None else self._skill_rows[rows], len(self.skill_vocab))
+
+    def matching_skills(self, resume_bits: np.ndarray, row: int) -> List[str]:
+        return self.skill_vocab.decode(self.skill_bits[row] & resume_bits)
+
+    def missing_skills(self, resume_bits: np.ndarray, row: int) -> List[str]:
+        return self.skill_vocab.decode(self.skill_bits[row] & ~resume_bits)
+
+    def add_job(self, job: Dict):
+        self.add_jobs([job])
+
+    def is_current(self, job: Dict) -> bool:
+        """Whether the same posting, field for field, is already live under its id"""
+        row = self.row_by_id.get(job.get('id'))
+        return row is not None and self.jobs[row] == job
+
+    def update_job(self, job: Dict):
+        """Replace the posting with the same id"""
+        self.add_jobs([job])
+
+    def expire_job(self, job_id) -> bool:
+        """Drop a posting from results; returns False if it is unknown"""
+        row = self.row_by_id.pop(job_id, None)
+        if row is None:
+            return False
+        self._on_expire(row)
+        self.jobs[row] = None
+        if self._active is not None and row < len(self._active):
+            self._active[row] = False
+        self._expired += 1
+        if self._expired > COMPACT_RATIO * len(self.jobs):
+            self.compact()
+        return True
+
+    def compact(self):
+        """Physically remove expired rows"""
+        keep = np.flatnonzero(self.active)
+        self._rows = RowBuffer(self.matrix[keep])
+        self.jobs = [self.jobs[row] for row in keep]
+        self.row_by_id = _ids_to_rows(job.get('id') for job in self.jobs)
+        self._skill_bits = self.skill_bits[keep]
+        self._skill_rows = [self._skill_rows[row] for row in keep]
+        self._required_counts = [self._required_counts[row] for row in keep]
+        self.skill_postings = {}
+        for row, ids in enumerate(self._skill_rows):
+            for skill_id in ids:
+                self.skill_postings.setdefault(self.skill_vocab.names[skill_id], []).append(row)
+        self._expired = 0
+        self.generation += 1
+        self._changed()
+
+    def scores(self, term_counts: Dict[str, int]) -> np.ndarray:
+        """Cosine similarity of a resume against every row; expired rows score 0"""
+        scores = self.score_rows(self.query(term_counts))
+        if self._expired:
+            scores[~self.active] = 0.0
+        return scores
+
+    def score_rows(self, query: sp.csr_matrix, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Exact cosine similarity of a query vector against some (or all) rows"""
+        matrix = self.matrix if rows is None else self.matrix[rows]
+        scores = (matrix @ query.T).toarray().ravel()
+        norms = self.row_norms()
+        if norms is not None:
+            scores /= norms if rows is None else norms[rows]
+        return scores
+
+    def row_norms(self) -> Optional[np.ndarray]:
+        """Per-row divisor applied to dot products; None when rows are pre-normalised"""
+        return None
+
+    def weighted_matrix(self, rows: Optional[slice] = None) -> sp.csr_matrix:
+        """Rows as L2-normalised TF-IDF vectors, the space ``transform`` maps resumes into"""
+        return self.matrix if rows is None else self.matrix[rows]
+
+    def transform(self, term_counts: Dict[str, int]) -> sp.csr_matrix:
+        """IDF-weighted, L2-normalised resume vector"""
+        return self.weight_counts(self.count_vector(term_counts))
+
+    def query(self, term_counts: Dict[str, int]) -> sp.csr_matrix:
+        """Query vector whose dot product with a row, over ``row_norms``, is the cosine similarity"""
+        return self.query_counts(self.count_vector(term_counts))
+
+    def query_counts(self, counts: sp.csr_matrix) -> sp.csr_matrix:
+        """Query vectors for rows of raw term counts, as kept by saved profiles"""
+        return self.weight_counts(counts)
+
+    def postings(self) -> Tuple[sp.csc_matrix, sp.csc_matrix, int]:
+        """Term -> rows inverted index as (settled rows, rows appended since, first appended row).
+
+        Expired rows stay in it and are masked by callers. Appended rows get
+        a small index of their own until they are a ``POSTINGS_TAIL_RATIO``
+        share of the matrix, when everything is folded into one again.
+        """
+        n_rows = len(self.jobs)
+        if self._csc is None or n_rows - self._csc_rows > POSTINGS_TAIL_RATIO * n_rows:
+            self._csc = self.matrix.tocsc()
+            self._csc_rows = n_rows
+            self._tail_csc = None
+        if self._tail_csc is None or self._csc_rows + self._tail_csc.shape[0] < n_rows:
+            self._tail_csc = self.matrix[self._csc_rows:].tocsc()
+        return self._csc, self._tail_csc, self._csc_rows
+
+    def term_candidates(self, query: sp.csr_matrix, max_terms: Optional[int],
+                        max_candidates: Optional[int]) -> np.ndarray:
+        """Rows sharing one of the query's highest-weighted terms, best partial scores first"""
+        terms, weights = query.indices, query.data
+        if max_terms is not None and len(terms) > max_terms:
+            top = np.argpartition(weights, -max_terms)[-max_terms:]
+            terms, weights = terms[top], weights[top]
+
+        settled, appended, first_appended = self.postings()
+        rows, contributions = [], []
+        # Term by term, so every row sums its contributions in the same order either side
+        for term, weight in zip(terms, weights):
+            for csc, offset in ((settled, 0), (appended, first_appended)):
+                start, end = csc.indptr[term], csc.indptr[term + 1]
+                rows.append(csc.indices[start:end] + offset)
+                contributions.append(csc.data[start:end] * weight)
+        if not rows:
+            return np.empty(0, dtype=np.int64)
+        rows = np.concatenate(rows)
+        partial = np.bincount(rows, weights=np.concatenate(contributions), minlength=len(self.jobs))
+        norms = self.row_norms()
+        if norms is not None:
+            partial /= norms
+        if self._expired:
+            partial[~self.active] = 0.0
+        candidates = np.flatnonzero(partial)
+        if max_candidates is not None and len(candidates) > max_candidates:
+            keep = np.argpartition(partial[candidates], -max_candidates)[-max_candidates:]
+            candidates = candidates[keep]
+        return candidates
+
+    def skill_candidates(self, skills: Iterable[str]) -> np.ndarray:
+        """Rows requiring at least one of the given skills"""
+        rows = [self.skill_postings[skill] for skill in skills if skill in self.skill_postings]
+        if not rows:
+            return np.empty(0, dtype=np.int64)
+        rows = np.unique(np.concatenate(rows))
+        return rows[self.active[rows]] if self._expired else rows
+
+    def save(self, path: str, write_extra: Optional[Callable[[str], None]] = None):
+        """Write a new snapshot directory and atomically point ``path`` at it.
+
+        Every save stages into its own directory next to ``path``, so
+        concurrent savers never write into each other's files, and ``path``
+        is a symlink swapped in one rename, so it always names a complete
+        snapshot. ``write_extra`` is called with the staging directory so
+        companion files (such as semantic vectors) are published together
+        with the index.
+        """
+        path = os.path.abspath(path.rstrip(os.sep))
+        staging = tempfile.mkdtemp(prefix=os.path.basename(path) + SNAPSHOT_DIR_INFIX, dir=os.path.dirname(path))
+        # mkdtemp creates the directory private to its owner; replicas may run as another user
+        os.chmod(staging, 0o755)
+
+        matrix = self.matrix
+        skill_lengths = [len(ids) for ids in self._skill_rows]
+        arrays = {
+            'matrix_data': matrix.data,
+            'matrix_indices': matrix.indices,
+            'matrix_indptr': matrix.indptr,
+            'skill_bits': self.skill_bits,
+            'skill_ids': np.concatenate(self._skill_rows + [np.empty(0, dtype=np.int64)]),
+            'skill_indptr': np.concatenate([[0], np.cumsum(skill_lengths)]).astype(np.int64),
+            'required_counts': self.required_counts
+        }
+        arrays.update(self._fitted_arrays())
+        for name, array in arrays.items():
+            np.save(os.path.join(staging, name + '.npy'), array)
+        # One JSON line per row ('null' for tombstones), with byte offsets so loads can map it lazily
+        job_offsets = [0]
+        with open(os.path.join(staging, JOBS_FILE), 'wb') as handle:
+            for job in self.jobs:
+                line = job.raw if isinstance(job, SnapshotJob) else json.dumps(job).encode('utf-8')
+                handle.write(line + b'\n')
+                job_offsets.append(job_offsets[-1] + len(line) + 1)
+        np.save(os.path.join(staging, 'job_offsets.npy'), np.array(job_offsets, dtype=np.int64))
+        with open(os.path.join(staging, JOB_IDS_FILE), 'w', encoding='utf-8') as handle:
+            json.dump([job.get('id') if job is not None else None for job in self.jobs], handle)
+        np.save(os.path.join(staging, 'job_live.npy'), self.active)
+        if write_extra is not None:
+            write_extra(staging)
+
+        manifest = {
+            'format_version': SNAPSHOT_VERSION,
+            'index_type': type(self).__name__,
+            'shape': list(matrix.shape),
+            'live_rows': len(self),
+            'generation': self.generation,
+            'skill_vocabulary': self.skill_vocab.names,
+            'created': time.time(),
+            **self._fitted_manifest()
+        }
+        # The manifest goes in last, so a directory without one is never a usable snapshot
+        with open(os.path.join(staging, MANIFEST_FILE), 'w', encoding='utf-8') as handle:
+            json.dump(manifest, handle)
+
+        _publish_snapshot(path, staging)
+
+    def _restore(self, path: str, manifest: Dict):
+        """Populate a bare instance from a snapshot; large arrays stay memory-mapped"""
+        def load(name, mmap_mode='r'):
+            return np.load(os.path.join(path, name + '.npy'), mmap_mode=mmap_mode)
+
+        self._rows = RowBuffer(sp.csr_matrix((load('matrix_data'), load('matrix_indices'), load('matrix_indptr')),
+                                             shape=tuple(manifest['shape'])))
+        live = load('job_live', mmap_mode=None)
+        offsets = load('job_offsets', mmap_mode=None).tolist()
+        with open(os.path.join(path, JOBS_FILE), 'rb') as handle:
+            # The mapping stays valid even after a newer snapshot replaces the directory
+            buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) if offsets[-1] else b''
+        self.jobs = [SnapshotJob(buffer, offsets[row], offsets[row + 1] - 1) if is_live else None
+                     for row, is_live in enumerate(live.tolist())]
+        with open(os.path.join(path, JOB_IDS_FILE), encoding='utf-8') as handle:
+            job_ids = json.load(handle)
+        self.row_by_id = _ids_to_rows(job_id if is_live else None for job_id, is_live in zip(job_ids, live.tolist()))
+        self._active = live
+        self._expired = len(self.jobs) - manifest['live_rows']
+        self.generation = manifest['generation']
+
+        self.skill_vocab = SkillVocabulary(manifest['skill_vocabulary'])
+        self._skill_bits = load('skill_bits')
+        skill_ids = load('skill_ids', mmap_mode=None)
+        skill_indptr = load('skill_indptr', mmap_mode=None)
+        bounds = skill_indptr.tolist()
+        self._skill_rows = [skill_ids[bounds[row]:bounds[row + 1]] for row in range(len(self.jobs))]
+        self._required_counts = load('required_counts', mmap_mode=None).tolist()
+
+        # Rebuild the skill -> rows postings with one sort instead of a loop per row
+        rows = np.repeat(np.arange(len(self.jobs)), np.diff(skill_indptr))
+        keep = live[rows]
+        rows, skill_ids = rows[keep], skill_ids[keep]
+        order = np.argsort(skill_ids, kind='stable')
+        rows, skill_ids = rows[order], skill_ids[order]
+        starts = np.flatnonzero(np.diff(skill_ids, prepend=-1))
+        for skill_id, postings in zip(skill_ids[starts].tolist(), np.split(rows, starts[1:])):
+            self.skill_postings[self.skill_vocab.names[skill_id]] = postings.tolist()
+        self._load_fitted(path, manifest)
+
+    def _fitted_arrays(self) -> Dict[str, np.ndarray]:
+        return {}
+
+    def _fitted_manifest(self) -> Dict:
+        return {}
+
+    def _load_fitted(self, path: str, manifest: Dict):
+        pass
+
+    def _changed(self):
+        """Rows were renumbered: drop every row-aligned derived structure"""
+        self._active = None
+        self._csc = None
+        self._tail_csc = None
+        self._on_change()
+
+    def _on_change(self):
+        pass
+
+    def _on_expire(self, row: int):
+        pass
+
+
+class TfidfJobIndex(JobIndex):
+    """TF-IDF index fitted once on an initial corpus.
+
+    Later postings are vectorized against the fitted vocabulary and IDF, so
+    adds and updates are cheap but unseen terms are ignored until refit.
+    """
+
+    def __init__(self, jobs: Iterable[Dict]):
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        super().__init__()
+        jobs = list(jobs)
+        self.vectorizer = TfidfVectorizer(analyzer=analyze_document)
+        # Rows are L2-normalised, so a dot product with a resume vector is the cosine similarity
+        self._rows = RowBuffer(self.vectorizer.fit_transform([job['description'] for job in jobs]).tocsr())
+        self.jobs = jobs
+        self.row_by_id = _ids_to_rows(job.get('id') for job in jobs)
+        for row, job in enumerate(jobs):
+            self._index_skills(job, row)
+        self.n_features = self._rows.n_features
+
+    def _vectorize_jobs(self, jobs: List[Dict]) -> sp.csr_matrix:
+        return self.vectorizer.transform([job['description'] for job in jobs])
+
+    def _fitted_arrays(self) -> Dict[str, np.ndarray]:
+        return {'idf': self.vectorizer.idf_}
+
+    def _fitted_manifest(self) -> Dict:
+        terms = [None] * len(self.vectorizer.vocabulary_)
+        for term, column in self.vectorizer.vocabulary_.items():
+            terms[column] = term
+        return {'vocabulary': terms}
+
+    def _load_fitted(self, path: str, manifest: Dict):
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        # Restore the fitted vocabulary and IDF instead of refitting
+        self.vectorizer = TfidfVectorizer(analyzer=analyze_document)
+        self.vectorizer.vocabulary_ = {term: column for column, term in enumerate(manifest['vocabulary'])}
+        self.vectorizer.idf_ = np.load(os.path.join(path, 'idf.npy'))
+        self.n_features = manifest['shape'][1]
+
+    def count_vector(self, term_counts: Dict[str, int]) -> sp.csr_matrix:
+        """Raw term counts over the fitted vocabulary; stop words were never fitted, so they drop out"""
+        vocabulary = self.vectorizer.vocabulary_
+        counts = {vocabulary[term]: count for term, count in term_counts.items() if term in vocabulary}
+        # Sorted columns, as CountVectorizer emits them, so weighting sums in the same order
+        columns = np.array(sorted(counts), dtype=np.int32)
+        values = np.array([counts[column] for column in columns.tolist()], dtype=np.float64)
+        return sp.csr_matrix((values, columns, np.array([0, len(columns)], dtype=np.int32)),
+                             shape=(1, self.n_features))
+
+    def weight_counts(self, counts: sp.csr_matrix) -> sp.csr_matrix:
+        """TF-IDF weighting as the fitted vectorizer applies it"""
+        from sklearn.preprocessing import normalize
+        weighted = counts.astype(np.float64)
+        weighted.data *= self.vectorizer.idf_[weighted.indices]
+        return normalize(weighted)
+
+
+class HashingJobIndex(JobIndex):
+    """Live index over hashed term counts with incrementally maintained IDF.
+
+    Nothing is ever fitted: each posting is hashed on its own, document
+    frequencies are updated as postings come and go, and IDF weighting and
+    row norms are applied at query time. Postings can be added, updated and
+    expired at any rate without a refit.
+
+    IDF depends on every posting, so it is refreshed, together with all row
+    norms, only once changes since the last refresh exceed ``REWEIGHT_RATIO``
+    of the live postings. In between, rows added since are normed under the
+    current IDF, which every scoring path shares.
+    """
+
+    def __init__(self, jobs: Iterable[Dict] = (), n_features: int = DEFAULT_HASH_FEATURES):
+        from sklearn.feature_extraction.text import HashingVectorizer
+        super().__init__()
+        self.n_features = n_features
+        self.vectorizer = HashingVectorizer(analyzer=analyze_document, n_features=n_features,
+                                            alternate_sign=False, norm=None)
+        self.document_frequency = np.zeros(n_features, dtype=np.int32)
+        self._idf = None
+        self._row_norms = None
+        self._unweighted_changes = 0
+        self._rows = RowBuffer(sp.csr_matrix((0, n_features)))
+        self.add_jobs(jobs)
+
+    def _vectorize_jobs(self, jobs: List[Dict]) -> sp.csr_matrix:
+        counts = self.vectorizer.transform([job['description'] for job in jobs]).tocsr()
+        np.add.at(self.document_frequency, counts.indices, 1)
+        self._unweighted_changes += len(jobs)
+        return counts
+
+    def _fitted_arrays(self) -> Dict[str, np.ndarray]:
+        # The IDF in effect is saved too, so a replica scores exactly as the writer did
+        return {'document_frequency': self.document_frequency, 'idf': self.idf}
+
+    def _fitted_manifest(self) -> Dict:
+        return {'unweighted_changes': self._unweighted_changes}
+
+    def _load_fitted(self, path: str, manifest: Dict):
+        from sklearn.feature_extraction.text import HashingVectorizer
+        self.n_features = manifest['shape'][1]
+        self.vectorizer = HashingVectorizer(analyzer=analyze_document, n_features=self.n_features,
+                                            alternate_sign=False, norm=None)
+        # Updated in place as postings change, so read into memory rather than mapped
+        self.document_frequency = np.load(os.path.join(path, 'document_frequency.npy'))
+        self._idf = np.load(os.path.join(path, 'idf.npy'), mmap_mode='r')
+        self._row_norms = None
+        self._unweighted_changes = manifest['unweighted_changes']
+
+    def _on_expire(self, row: int):
+        # Read from the row arrays, so expiring never stacks or copies the matrix
+        np.subtract.at(self.document_frequency, self._rows.row_indices(row), 1)
+        self._unweighted_changes += 1
+
+    def _on_change(self):
+        # Compaction keeps the live postings, so only the row-aligned norms go
+        self._row_norms = None
+
+    @property
+    def idf(self) -> np.ndarray:
+        """Smoothed IDF, as TfidfVectorizer computes it"""
+        if self._idf is None or self._unweighted_changes > REWEIGHT_RATIO * len(self):
+            n_documents = len(self)
+            self._idf = np.log((1 + n_documents) / (1 + self.document_frequency)) + 1
+            self._row_norms = None
+            self._unweighted_changes = 0
+        return self._idf
+
+    def row_norms(self) -> np.ndarray:
+        """IDF-weighted norms of the stored count rows; rows added since the last call are normed alone"""
+        idf = self.idf
+        known = 0 if self._row_norms is None else len(self._row_norms)
+        if known < len(self.jobs):
+            rows = self.matrix if known == 0 else self.matrix[known:]
+            norms = np.sqrt(rows.multiply(rows) @ (idf ** 2))
+            norms[norms == 0] = 1.0
+            self._row_norms = norms if known == 0 else np.concatenate([self._row_norms, norms])
+        return self._row_norms
+
+    def weighted_matrix(self, rows: Optional[slice] = None) -> sp.csr_matrix:
+        matrix = self.matrix if rows is None else self.matrix[rows]
+        norms = self.row_norms() if rows is None else self.row_norms()[rows]
+        return (sp.diags(1 / norms) @ matrix @ sp.diags(self.idf)).tocsr()
+
+    def count_vector(self, term_counts: Dict[str, int]) -> sp.csr_matrix:
+        """Raw hashed term counts; stable across processes and corpus changes"""
+        from sklearn.feature_extraction import FeatureHasher
+        stop_words = _english_stop_words()
+        # Hashes each term exactly as the vectorizer does, weighted by its count
+        hasher = FeatureHasher(n_features=self.n_features, input_type='pair', alternate_sign=False)
+        return hasher.transform([[(term, count) for term, count in term_counts.items()
+                                  if term not in stop_words]]).tocsr()
+
+    def weight_counts(self, counts: sp.csr_matrix) -> sp.csr_matrix:
+        """IDF-weight and L2-normalise count rows under the current document frequencies"""
+        from sklearn.preprocessing import normalize
+        weighted = counts.astype(np.float64)
+        # Like a fitted vocabulary, ignore terms no live posting contains
+        weighted.data *= self.idf[weighted.indices] * (self.document_frequency[weighted.indices] > 0)
+        weighted.eliminate_zeros()
+        return normalize(weighted)
+
+    def query_counts(self, counts: sp.csr_matrix) -> sp.csr_matrix:
+        query = self.weight_counts(counts)
+        # Stored rows hold raw counts, so their IDF weight is folded into the query
+        query.data *= self.idf[query.indices]
+        return query
+
+
+SNAPSHOT_TYPES = {cls.__name__: cls for cls in (TfidfJobIndex, HashingJobIndex)}
+
+
+def load_index(path: str) -> JobIndex:
+    """Open a snapshot written by ``JobIndex.save`` without refitting anything"""
+    # Resolved once, so a save publishing meanwhile cannot mix files from two versions
+    path = os.path.realpath(path)
+    with open(os.path.join(path, MANIFEST_FILE), encoding='utf-8') as handle:
+        manifest = json.load(handle)
+    if manifest.get('format_version') != SNAPSHOT_VERSION:
+        raise Exception(f"Unsupported index snapshot version {manifest.get('format_version')} in {path}")
+    cls = SNAPSHOT_TYPES.get(manifest.get('index_type'))
+    if cls is None:
+        raise Exception(f"Unknown index type {manifest.get('index_type')} in {path}")
+    index = cls.__new__(cls)
+    JobIndex.__init__(index)
+    index._restore(path, manifest)
+    return index
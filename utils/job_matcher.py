@@ -1,146 +1,331 @@
+import heapq
 import json
+import os
 import re
-from typing import Dict, List, Tuple
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
 import numpy as np
+import scipy.sparse as sp
+from utils.job_corpus import SAMPLE_JOBS_PATH, iter_jobs
+from utils.job_index import HashingJobIndex, JobIndex, TfidfJobIndex, load_index
+from utils.semantic_index import SemanticIndex
+from utils.tokens import TokenStream
+
+# Postings are vectorized in batches of this size while a feed streams in
+FEED_BATCH_SIZE = 10_000
+# Candidate generation: look up this many of the resume's strongest terms and
+# exactly score at most this many postings; smaller corpora are scored in full
+DEFAULT_MAX_QUERY_TERMS = 32
+DEFAULT_MAX_CANDIDATES = 2000
+# Batch matching keeps the score tiles of all workers under this many bytes
+DEFAULT_BATCH_MEMORY = 256 * 1024 * 1024
+# float64 similarity, skill and blended score plus the int64 ranking key per cell
+BATCH_BYTES_PER_CELL = 32
+# Ranking keys pack the score above a reversed row number, so ties go to the earlier row
+RANK_SHIFT = 2 ** 32
+# Semantic vectors, when present, are kept in this subdirectory of an index snapshot
+SEMANTIC_SNAPSHOT_DIR = 'semantic'
+
+
+def match_score_tenths(similarity, skill_match):
+    """Blend text similarity (60%) and skill coverage (40%) into a score in tenths of a percent"""
+    return np.rint((similarity * 0.6 + skill_match * 0.4) * 1000)
+
+
+def _rank_keys(tenths: np.ndarray, positions: np.ndarray) -> np.ndarray:
+    return tenths.astype(np.int64) * RANK_SHIFT + (RANK_SHIFT - 1 - positions)
+
+
+def _top_k(arrays: List[np.ndarray], k: int) -> List[np.ndarray]:
+    """Keep the k largest ranking keys per row; ``arrays[0]`` holds the keys"""
+    keys = arrays[0]
+    if keys.shape[1] <= k:
+        return arrays
+    top = np.argpartition(keys, -k, axis=1)[:, -k:]
+    return [np.take_along_axis(array, top, axis=1) for array in arrays]
+
+
+def _merge_top_k(best: List[np.ndarray], tile: List[np.ndarray], k: int) -> List[np.ndarray]:
+    if best is None:
+        return tile
+    return _top_k([np.concatenate(pair, axis=1) for pair in zip(best, tile)], k)
 
 class JobMatcher:
-    def __init__(self):
-        self.sample_jobs = self._load_sample_jobs()
-        self.vectorizer = TfidfVectorizer(stop_words='english')
+    def __init__(self, jobs: List[Dict] = None, index: JobIndex = None,
+                 max_query_terms: int = DEFAULT_MAX_QUERY_TERMS,
+                 max_candidates: int = DEFAULT_MAX_CANDIDATES, semantic: SemanticIndex = None):
+        self.max_query_terms = max_query_terms
+        # Optional latent vectors; when set they replace lexical TF-IDF for the similarity score
+        self.semantic = semantic
+        self.max_candidates = max_candidates
+        # Vocabulary and IDF are fitted once over the whole corpus, not per resume/job pair
+        self.index = index if index is not None else TfidfJobIndex(
+            jobs if jobs is not None else self._load_sample_jobs()
+        )
+
+    @classmethod
+    def from_feed(cls, path: str) -> 'JobMatcher':
+        """Build a live, hashing-based index by streaming a JSON/JSONL job feed"""
+        matcher = cls(index=HashingJobIndex())
+        matcher.apply_updates(iter_jobs(path))
+        return matcher
+
+    @classmethod
+    def from_snapshot(cls, path: str, **kwargs) -> 'JobMatcher':
+        """Serve from a saved snapshot: arrays are memory-mapped and nothing is refitted"""
+        # Index and semantic vectors must come from the same version, even if a save publishes meanwhile
+        path = os.path.realpath(path)
+        index = load_index(path)
+        semantic_path = os.path.join(path, SEMANTIC_SNAPSHOT_DIR)
+        if os.path.isdir(semantic_path):
+            kwargs.setdefault('semantic', SemanticIndex.load(semantic_path, generation=index.generation))
+        return cls(index=index, **kwargs)
+
+    def save_snapshot(self, path: str):
+        """Write the index (and semantic vectors, if any) as one versioned snapshot"""
+        write_semantic = None
+        if self.semantic is not None:
+            self.semantic.sync(self.index)
+            write_semantic = lambda staging: self.semantic.save(os.path.join(staging, SEMANTIC_SNAPSHOT_DIR))
+        self.index.save(path, write_extra=write_semantic)
+
+    @property
+    def sample_jobs(self) -> List[Dict]:
+        """Live postings in index order"""
+        return [job for job in self.index.jobs if job is not None]
+
+    def add_job(self, job: Dict):
+        self.index.add_job(job)
+
+    def update_job(self, job: Dict):
+        self.index.update_job(job)
+
+    def expire_job(self, job_id) -> bool:
+        return self.index.expire_job(job_id)
+
+    def apply_updates(self, jobs: Iterable[Dict], on_added: Callable[[slice], None] = None):
+        """Apply a feed of postings: new ids are added, known ids updated, expired ones dropped.
+
+        Postings re-sent unchanged are left alone. ``on_added`` is called
+        after each batch with the slice of rows it appended (new and changed
+        postings only), while those row numbers are still valid.
+        """
+        jobs = iter(jobs)
+        while True:
+            batch = list(islice(jobs, FEED_BATCH_SIZE))
+            if not batch:
+                return
+            # Latest record per id wins within a batch
+            pending, unkeyed = {}, []
+            for job in batch:
+                job_id = job.get('id')
+                if job.get('expired') or job.get('status') == 'expired':
+                    pending.pop(job_id, None)
+                    self.index.expire_job(job_id)
+                elif job_id is None:
+                    unkeyed.append(job)
+                else:
+                    pending[job_id] = job
+            # A full feed re-sends every live posting; only new or changed ones are re-vectorized
+            added = [job for job in pending.values() if not self.index.is_current(job)] + unkeyed
+            self.index.add_jobs(added)
+            if on_added is not None and added:
+                on_added(slice(len(self.index.jobs) - len(added), len(self.index.jobs)))
 
     def _load_sample_jobs(self) -> List[Dict]:
         """Load sample job descriptions"""
-        return [
-            {
-                "id": 1,
-                "title": "Senior Data Scientist",
-                "company": "Tech Innovations Inc.",
-                "description": "We're looking for a Senior Data Scientist with strong Python skills, experience with machine learning frameworks like TensorFlow or PyTorch, and expertise in data analysis. Requirements include 5+ years of experience, advanced degree in Computer Science or related field, and proficiency with SQL and big data technologies.",
-                "required_skills": ["python", "machine learning", "tensorflow", "pytorch", "sql", "data analysis"],
-                "preferred_skills": ["aws", "docker", "kubernetes", "spark"],
-                "experience_level": "senior",
-                "salary_range": "$120,000 - $160,000"
-            },
-            {
-                "id": 2,
-                "title": "Full Stack Developer",
-                "company": "Web Solutions LLC",
-                "description": "Join our team as a Full Stack Developer. You'll work with modern technologies including React, Node.js, Python, and cloud platforms. Ideal candidate has 3+ years of experience, strong JavaScript skills, and experience with database design and RESTful APIs.",
-                "required_skills": ["javascript", "react", "node.js", "python", "sql", "rest api"],
-                "preferred_skills": ["aws", "docker", "typescript", "mongodb"],
-                "experience_level": "mid",
-                "salary_range": "$90,000 - $120,000"
-            },
-            {
-                "id": 3,
-                "title": "Machine Learning Engineer",
-                "company": "AI Pioneers Corp",
-                "description": "Machine Learning Engineer needed to design and implement ML systems. Requires expertise in Python, deep learning, model deployment, and MLOps. Experience with cloud platforms and containerization is a plus.",
-                "required_skills": ["python", "machine learning", "deep learning", "mlops", "docker"],
-                "preferred_skills": ["kubernetes", "aws", "azure", "tensorflow", "pytorch"],
-                "experience_level": "mid-senior",
-                "salary_range": "$110,000 - $150,000"
-            },
-            {
-                "id": 4,
-                "title": "DevOps Engineer",
-                "company": "Cloud Systems Ltd",
-                "description": "DevOps Engineer to manage our cloud infrastructure. Skills needed: AWS, Docker, Kubernetes, CI/CD pipelines, Terraform, and monitoring tools. Linux administration and scripting skills required.",
-                "required_skills": ["aws", "docker", "kubernetes", "ci/cd", "terraform", "linux"],
-                "preferred_skills": ["python", "bash", "jenkins", "prometheus"],
-                "experience_level": "mid-senior",
-                "salary_range": "$100,000 - $140,000"
-            },
-            {
-                "id": 5,
-                "title": "Data Analyst",
-                "company": "Business Insights Co.",
-                "description": "Data Analyst position focusing on business intelligence and reporting. Required: SQL, Python, data visualization (Tableau/Power BI), statistical analysis. Experience with ETL processes and database management.",
-                "required_skills": ["sql", "python", "data visualization", "tableau", "statistics"],
-                "preferred_skills": ["power bi", "excel", "etl", "postgresql"],
-                "experience_level": "entry-mid",
-                "salary_range": "$65,000 - $85,000"
-            }
-        ]
+        return list(iter_jobs(SAMPLE_JOBS_PATH))
 
     def match_resume_to_jobs(self, resume_data: Dict, top_n: int = 5) -> List[Dict]:
         """Match resume against job database"""
-        resume_text = self._prepare_resume_text(resume_data)
-        matches = []
-        
-        for job in self.sample_jobs:
-            similarity_score = self._calculate_similarity(resume_text, job)
-            skill_match = self._calculate_skill_match(resume_data.get('skills', {}), job['required_skills'])
-            
-            overall_score = (similarity_score * 0.6) + (skill_match * 0.4)
-            
-            matches.append({
-                **job,
-                'match_score': round(overall_score * 100, 1),
-                'similarity_score': round(similarity_score * 100, 1),
-                'skill_match_score': round(skill_match * 100, 1),
-                'missing_skills': self._find_missing_skills(resume_data.get('skills', {}), job['required_skills']),
-                'matching_skills': self._find_matching_skills(resume_data.get('skills', {}), job['required_skills'])
-            })
-        
-        # Sort by match score and return top N
-        return sorted(matches, key=lambda x: x['match_score'], reverse=True)[:top_n]
-
-    def _prepare_resume_text(self, resume_data: Dict) -> str:
-        """Prepare resume text for similarity analysis"""
-        sections = [
-            resume_data.get('raw_text', ''),
-            ' '.join([str(exp) for exp in resume_data.get('experience', [])]),
-            ' '.join([skill for category in resume_data.get('skills', {}).values() for skill in category])
-        ]
-        return ' '.join(sections)
-
-    def _calculate_similarity(self, resume_text: str, job: Dict) -> float:
-        """Calculate text similarity between resume and job description"""
-        try:
-            documents = [resume_text, job['description']]
-            tfidf_matrix = self.vectorizer.fit_transform(documents)
-            similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])
-            return similarity[0][0]
-        except:
-            return 0.5  # Default medium similarity
-
-    def _calculate_skill_match(self, resume_skills: Dict, required_skills: List[str]) -> float:
-        """Calculate skill matching percentage"""
-        if not required_skills:
-            return 0.0
-            
-        # Flatten resume skills
-        resume_skill_list = []
-        for category_skills in resume_skills.values():
-            resume_skill_list.extend(category_skills)
+        resume_skills = resume_data.get('skills', {})
+        term_counts = self._resume_term_counts(resume_data)
         
-        resume_skill_list = [skill.lower() for skill in resume_skill_list]
-        required_skills_lower = [skill.lower() for skill in required_skills]
+        if self.semantic is not None:
+            # Dense latent vectors are cheap enough to score every live posting
+            self.semantic.sync(self.index)
+            rows = np.flatnonzero(self.index.active)
+            similarity_scores = self.semantic.scores(self.semantic.query(self.index, term_counts))[rows]
+        else:
+            query = self.index.query(term_counts)
+            # Stage one: cheap candidates from the term and skill inverted indexes
+            rows = self._candidate_rows(query, resume_skills, top_n)
+            # Stage two: exact scores for the candidates only
+            similarity_scores = self.index.score_rows(query, rows)
         
-        matching_skills = set(resume_skill_list) & set(required_skills_lower)
-        return len(matching_skills) / len(required_skills_lower)
-
-    def _find_missing_skills(self, resume_skills: Dict, required_skills: List[str]) -> List[str]:
-        """Find skills missing from resume"""
-        resume_skill_list = []
-        for category_skills in resume_skills.values():
-            resume_skill_list.extend(category_skills)
+        resume_bits = self._resume_skill_bits(resume_skills)
+        skill_scores = self.index.skill_match(resume_bits, rows)
+        match_scores = match_score_tenths(similarity_scores, skill_scores)
         
-        resume_skill_list = [skill.lower() for skill in resume_skill_list]
-        required_skills_lower = [skill.lower() for skill in required_skills]
-        
-        return list(set(required_skills_lower) - set(resume_skill_list))
+        # Heap-based top N; result dicts are built for the winners only
+        best = heapq.nlargest(top_n, range(len(rows)), key=match_scores.__getitem__)
+        return [
+            self._build_match(rows[i], match_scores[i], similarity_scores[i], skill_scores[i], resume_bits)
+            for i in best
+        ]
 
-    def _find_matching_skills(self, resume_skills: Dict, required_skills: List[str]) -> List[str]:
-        """Find matching skills between resume and job"""
-        resume_skill_list = []
-        for category_skills in resume_skills.values():
-            resume_skill_list.extend(category_skills)
+    def _candidate_rows(self, query, resume_skills: Dict, top_n: int) -> np.ndarray:
+        """Rows worth scoring exactly, in index order"""
+        index = self.index
+        if self.max_candidates is None or len(index) <= self.max_candidates:
+            return np.flatnonzero(index.active)
         
-        resume_skill_list = [skill.lower() for skill in resume_skill_list]
-        required_skills_lower = [skill.lower() for skill in required_skills]
-        
-        return list(set(resume_skill_list) & set(required_skills_lower))
\ No newline at end of file
+        skill_names = {skill.lower() for category in resume_skills.values() for skill in category}
+        rows = np.union1d(
+            index.term_candidates(query, self.max_query_terms, self.max_candidates),
+            index.skill_candidates(skill_names)
+        )
+        if len(rows) < top_n:
+            # Too few overlapping postings; fill up with the first other live ones
+            extra = np.flatnonzero(index.active)
+            extra = extra[~np.isin(extra, rows)][:top_n - len(rows)]
+            rows = np.union1d(rows, extra)
+        return rows
+
+    def _build_match(self, row: int, match_tenths: float, similarity_score: float, skill_match: float,
+                     resume_bits: np.ndarray) -> Dict:
+        """Result dict for one returned posting"""
+        return {
+            **self.index.jobs[row],
+            **self._score_fields(match_tenths, similarity_score, skill_match),
+            'missing_skills': self.index.missing_skills(resume_bits, row),
+            'matching_skills': self.index.matching_skills(resume_bits, row)
+        }
+
+    @staticmethod
+    def _score_fields(match_tenths: float, similarity_score: float, skill_match: float) -> Dict:
+        return {
+            'match_score': float(match_tenths) / 10,
+            'similarity_score': round(float(similarity_score) * 100, 1),
+            'skill_match_score': round(float(skill_match) * 100, 1)
+        }
+
+    def match_batch(self, resumes: Sequence[Dict], jobs_per_resume: int = 5, resumes_per_job: int = 5,
+                    memory_limit: int = DEFAULT_BATCH_MEMORY, workers: int = None) -> Dict:
+        """Score many resumes against every live job, returning top matches in both directions.
+
+        The resume x job score matrix is computed in tiles by a thread pool,
+        with tile sizes chosen so the tiles in flight stay under
+        ``memory_limit`` bytes. Every pair is scored exactly, with the same
+        arithmetic as ``match_resume_to_jobs``. A direction asked for zero
+        results is skipped.
+        """
+        index = self.index
+        workers = workers or os.cpu_count() or 1
+        n_resumes, n_rows = len(resumes), len(index.jobs)
+        jobs_per_resume = min(jobs_per_resume, n_rows)
+        resumes_per_job = min(resumes_per_job, n_resumes)
+        if not n_resumes or not len(index):
+            return {'jobs_per_resume': [[] for _ in resumes], 'resumes_per_job': {}}
+
+        # Resume-side inputs, each built exactly as the single-resume path builds it
+        # Counts are stacked first so IDF weighting and normalisation run once for the whole batch
+        counts = sp.vstack([index.count_vector(self._resume_term_counts(resume)) for resume in resumes],
+                           format='csr')
+        semantic = self.semantic
+        if semantic is not None:
+            semantic.sync(index)
+            latent = semantic.project(index.weight_counts(counts))
+        else:
+            queries = index.query_counts(counts)
+        resume_skill_ids = [
+            index.skill_vocab.encode(skill for category in resume.get('skills', {}).values() for skill in category)
+            for resume in resumes
+        ]
+        resume_skills = sp.csr_matrix(
+            (np.ones(sum(len(ids) for ids in resume_skill_ids)),
+             np.concatenate(resume_skill_ids + [np.empty(0, dtype=np.int64)]),
+             np.concatenate([[0], np.cumsum([len(ids) for ids in resume_skill_ids])]).astype(np.int64)),
+            shape=(n_resumes, len(index.skill_vocab))
+        )
+        matrix, job_skills = index.matrix, index.skill_indicator()
+        norms, required, active = index.row_norms(), index.required_counts, index.active
+
+        cells = max(1, memory_limit // (BATCH_BYTES_PER_CELL * workers))
+        job_tile = min(n_rows, cells)
+        resume_tile = max(1, min(n_resumes, cells // job_tile))
+
+        def score_tile(job_start: int, resume_start: int):
+            jobs = slice(job_start, job_start + job_tile)
+            batch = slice(resume_start, resume_start + resume_tile)
+            if semantic is not None:
+                similarity = np.stack([semantic.scores(vector, jobs) for vector in latent[batch]], axis=1)
+            else:
+                # (jobs, resumes) orientation: each cell sums its terms in the same order as score_rows
+                similarity = (matrix[jobs] @ queries[batch].T).toarray()
+                if norms is not None:
+                    similarity /= norms[jobs, None]
+            matching = (job_skills[jobs] @ resume_skills[batch].T).toarray()
+            skill_match = np.divide(matching, required[jobs, None], out=np.zeros(matching.shape),
+                                    where=required[jobs, None] > 0)
+            tenths = match_score_tenths(similarity, skill_match)
+            job_rows = np.arange(jobs.start, jobs.start + tenths.shape[0])
+            resume_rows = np.arange(batch.start, batch.start + tenths.shape[1])
+
+            by_resume = by_job = None
+            if jobs_per_resume:
+                job_keys = _rank_keys(tenths.T, job_rows[None, :])
+                job_keys[:, ~active[jobs]] = -1
+                by_resume = _top_k([job_keys, np.broadcast_to(job_rows, job_keys.shape), similarity.T, skill_match.T],
+                                   jobs_per_resume)
+            if resumes_per_job:
+                resume_keys = _rank_keys(tenths, resume_rows[None, :])
+                by_job = _top_k([resume_keys, np.broadcast_to(resume_rows, resume_keys.shape), similarity,
+                                 skill_match], resumes_per_job)
+            return job_start, resume_start, by_resume, by_job
+
+        best_jobs, best_resumes = {}, {}
+        tiles = [(job_start, resume_start) for job_start in range(0, n_rows, job_tile)
+                 for resume_start in range(0, n_resumes, resume_tile)]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for job_start, resume_start, by_resume, by_job in executor.map(lambda tile: score_tile(*tile), tiles):
+                if by_resume is not None:
+                    best_jobs[resume_start] = _merge_top_k(best_jobs.get(resume_start), by_resume, jobs_per_resume)
+                if by_job is not None:
+                    best_resumes[job_start] = _merge_top_k(best_resumes.get(job_start), by_job, resumes_per_job)
+
+        matches = []
+        for resume_start in range(0, n_resumes, resume_tile):
+            if resume_start not in best_jobs:
+                matches.extend([] for _ in range(min(resume_tile, n_resumes - resume_start)))
+                continue
+            keys, rows, similarity, skill_match = best_jobs[resume_start]
+            for offset, order in enumerate(np.argsort(-keys, axis=1)):
+                resume_bits = index.skill_vocab.pack(resume_skill_ids[resume_start + offset])
+                matches.append([
+                    self._build_match(rows[offset, i], keys[offset, i] // RANK_SHIFT, similarity[offset, i],
+                                      skill_match[offset, i], resume_bits)
+                    for i in order if keys[offset, i] >= 0
+                ])
+
+        candidates = {}
+        for job_start in best_resumes:
+            keys, resume_rows, similarity, skill_match = best_resumes[job_start]
+            for offset, order in enumerate(np.argsort(-keys, axis=1)):
+                job = index.jobs[job_start + offset]
+                if job is None:
+                    continue
+                candidates[job.get('id', job_start + offset)] = [
+                    {'resume_index': int(resume_rows[offset, i]),
+                     **self._score_fields(keys[offset, i] // RANK_SHIFT, similarity[offset, i], skill_match[offset, i])}
+                    for i in order
+                ]
+        return {'jobs_per_resume': matches, 'resumes_per_job': candidates}
+
+    def _resume_skill_bits(self, resume_skills: Dict) -> np.ndarray:
+        """Flatten the resume's skills once into a bitset over the job skill vocabulary"""
+        return self.index.skill_bitset(skill for category in resume_skills.values() for skill in category)
+
+    def _resume_term_counts(self, resume_data: Dict) -> Counter:
+        """Term counts for similarity analysis, reusing the counts the parser kept"""
+        extra_text = ' '.join([
+            ' '.join([str(exp) for exp in resume_data.get('experience', [])]),
+            ' '.join([skill for category in resume_data.get('skills', {}).values() for skill in category])
+        ])
+        term_counts = Counter()
+        for counted in (TokenStream.term_counts_for(resume_data), TokenStream.from_text(extra_text).term_counts()):
+            for term, count in zip(counted['terms'], counted['counts']):
+                term_counts[term] += count
+        return term_counts
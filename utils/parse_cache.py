@@ -0,0 +1,109 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'resume-analyzer', 'parse_cache.sqlite3')
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class ParseCache:
+    """Content-addressed parse result cache backed by SQLite.
+
+    Entries are keyed by a hash of the file bytes plus the parser version, so
+    re-uploading the same resume skips extraction entirely while a taxonomy
+    or rule change invalidates old results. SQLite in WAL mode lets several
+    worker processes on one host share the same cache file. Least recently
+    used entries are evicted once the stored results exceed ``max_bytes``.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = path or DEFAULT_CACHE_PATH
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS parse_cache ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, last_access REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS parse_cache_last_access ON parse_cache (last_access)")
+
+    def _connection(self) -> sqlite3.Connection:
+        """One connection per thread; SQLite handles cross-process locking"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def make_key(data: bytes, version: str) -> str:
+        """Hash the file content together with the parser version"""
+        digest = hashlib.sha256(data)
+        digest.update(b'\0' + version.encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return a cached result, or None on a miss"""
+        conn = self._connection()
+        row = conn.execute("SELECT value FROM parse_cache WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        conn.execute("UPDATE parse_cache SET last_access = ? WHERE key = ?", (time.time(), key))
+        self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, result: Dict):
+        """Store a result and evict least recently used entries over budget"""
+        value = json.dumps(result).encode('utf-8')
+        conn = self._connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO parse_cache (key, value, size, last_access) VALUES (?, ?, ?, ?)",
+            (key, value, len(value), time.time())
+        )
+        self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection):
+        """Drop the oldest entries until the total size fits the budget"""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM parse_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        freed = 0
+        stale_keys = []
+        for key, size in conn.execute("SELECT key, size FROM parse_cache ORDER BY last_access"):
+            stale_keys.append((key,))
+            freed += size
+            if total - freed <= self.max_bytes:
+                break
+        conn.executemany("DELETE FROM parse_cache WHERE key = ?", stale_keys)
+
+    def clear(self):
+        """Remove every cached entry"""
+        self._connection().execute("DELETE FROM parse_cache")
+
+    def stats(self) -> Dict:
+        """Hit/miss counters for this process and the store's current size"""
+        entries, size = self._connection().execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM parse_cache"
+        ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': entries,
+            'size_bytes': size
+        }
@@ -0,0 +1,106 @@
+import io
+import time
+from contextlib import contextmanager
+from typing import BinaryIO, Dict, Iterator, List, Optional, Union
+
+# Characters that routinely appear in well-extracted resume text
+READABLE_PUNCTUATION = set(".,;:-–—()/@+&'\"%#*|•·!?$")
+MIN_TEXT_CHARS = 20
+MIN_READABLE_RATIO = 0.85
+MAX_AVG_WORD_LENGTH = 25
+
+
+class FastPdfBackend:
+    """Plain text-stream extraction through PyPDF2, no layout analysis"""
+    name = 'fast'
+
+    @contextmanager
+    def open(self, source: Union[str, BinaryIO]):
+        # PDF libraries are imported on first use to keep app start-up cheap
+        from PyPDF2 import PdfReader
+        yield PdfReader(source)
+
+    def page_count(self, doc) -> int:
+        return len(doc.pages)
+
+    def extract_page(self, doc, index: int) -> str:
+        return doc.pages[index].extract_text() or ""
+
+
+class LayoutPdfBackend:
+    """Layout-aware extraction through pdfplumber; slower but robust"""
+    name = 'layout'
+
+    @contextmanager
+    def open(self, source: Union[str, BinaryIO]):
+        import pdfplumber
+        with pdfplumber.open(source) as pdf:
+            yield pdf
+
+    def page_count(self, doc) -> int:
+        return len(doc.pages)
+
+    def extract_page(self, doc, index: int) -> str:
+        page = doc.pages[index]
+        text = page.extract_text() or ""
+        # Drop parsed layout objects as soon as the page is done
+        page.close()
+        return text
+
+
+PDF_BACKENDS = {
+    FastPdfBackend.name: FastPdfBackend(),
+    LayoutPdfBackend.name: LayoutPdfBackend()
+}
+PDF_BACKEND_MODES = ('auto',) + tuple(PDF_BACKENDS)
+
+
+def get_pdf_backend(name: str):
+    """Look up a concrete backend by name"""
+    try:
+        return PDF_BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown PDF backend: {name!r} (expected one of {', '.join(PDF_BACKEND_MODES)})")
+
+
+def iter_backend_pages(backend, source: Union[str, BinaryIO], max_pages: Optional[int] = None) -> Iterator[str]:
+    """Yield page texts in order from one backend"""
+    with backend.open(source) as doc:
+        page_count = backend.page_count(doc)
+        if max_pages is not None:
+            page_count = min(page_count, max_pages)
+        for index in range(page_count):
+            yield backend.extract_page(doc, index)
+
+
+def looks_garbled(text: str) -> bool:
+    """Heuristic check for empty, undecodable or run-together text"""
+    stripped = text.strip()
+    if len(stripped) < MIN_TEXT_CHARS:
+        return True
+    if '�' in stripped or '(cid:' in stripped:
+        return True
+
+    readable = sum(1 for char in stripped if char.isalnum() or char.isspace() or char in READABLE_PUNCTUATION)
+    if readable / len(stripped) < MIN_READABLE_RATIO:
+        return True
+
+    # Missing word spacing shows up as implausibly long "words"
+    words = stripped.split()
+    return sum(len(word) for word in words) / len(words) > MAX_AVG_WORD_LENGTH
+
+
+def compare_pdf_backends(source: Union[str, bytes], max_pages: Optional[int] = None,
+                         backends: Optional[List[str]] = None) -> Dict[str, Dict]:
+    """Time each backend on the same PDF and report output size and quality"""
+    results = {}
+    for name in backends or list(PDF_BACKENDS):
+        stream = io.BytesIO(source) if isinstance(source, bytes) else source
+        start = time.perf_counter()
+        text = "\n".join(iter_backend_pages(get_pdf_backend(name), stream, max_pages))
+        results[name] = {
+            'seconds': time.perf_counter() - start,
+            'chars': len(text),
+            'garbled': looks_garbled(text)
+        }
+    return results
@@ -0,0 +1,153 @@
+import json
+import os
+from typing import Dict, Iterable, List
+
+import numpy as np
+import scipy.sparse as sp
+
+from utils.job_index import skill_indicator
+from utils.job_matcher import BATCH_BYTES_PER_CELL, DEFAULT_BATCH_MEMORY, JobMatcher, match_score_tenths
+
+# Match score (in percent) at which a new posting is reported for a saved profile
+DEFAULT_ALERT_THRESHOLD = 60.0
+PROFILE_COUNTS_FILE = 'profile_counts.npz'
+PROFILES_FILE = 'profiles.json'
+
+
+class ProfileStore:
+    """Saved candidate profiles, matched incrementally as new postings arrive.
+
+    Each profile keeps the resume's raw term counts and its skills as ids in
+    the job index's append-only skill vocabulary. Counts rather than weighted
+    vectors are kept so a live index's current IDF is applied at scoring
+    time, and scores equal what ``match_resume_to_jobs`` reports for the same
+    pair. ``ingest`` only scores the postings a feed adds or changes, so
+    alerting cost follows the number of new postings, not the size of the
+    corpus, even when the feed re-sends every live posting.
+    """
+
+    def __init__(self, matcher: JobMatcher, memory_limit: int = DEFAULT_BATCH_MEMORY):
+        self.matcher = matcher
+        self.memory_limit = memory_limit
+        self.profile_ids: List = []
+        self.row_by_id: Dict = {}
+        self._counts: List[sp.csr_matrix] = []
+        self._skill_ids: List[np.ndarray] = []
+        self._stacked = None
+
+    def __len__(self) -> int:
+        return len(self.profile_ids)
+
+    def add_profile(self, profile_id, resume_data: Dict):
+        """Save (or replace) a parsed resume under an id"""
+        index = self.matcher.index
+        counts = index.count_vector(self.matcher._resume_term_counts(resume_data))
+        skills = (skill for category in resume_data.get('skills', {}).values() for skill in category)
+        # Added to the vocabulary, so postings that later require these skills line up
+        self._store(profile_id, counts, index.skill_vocab.encode(skills, add=True))
+
+    def _store(self, profile_id, counts: sp.csr_matrix, skill_ids: np.ndarray):
+        row = self.row_by_id.get(profile_id)
+        if row is None:
+            self.row_by_id[profile_id] = len(self.profile_ids)
+            self.profile_ids.append(profile_id)
+            self._counts.append(counts)
+            self._skill_ids.append(skill_ids)
+        else:
+            self._counts[row] = counts
+            self._skill_ids[row] = skill_ids
+        self._stacked = None
+
+    def remove_profile(self, profile_id) -> bool:
+        """Forget a profile; returns False if it is unknown"""
+        row = self.row_by_id.pop(profile_id, None)
+        if row is None:
+            return False
+        for rows in (self.profile_ids, self._counts, self._skill_ids):
+            del rows[row]
+        self.row_by_id = {profile_id: row for row, profile_id in enumerate(self.profile_ids)}
+        self._stacked = None
+        return True
+
+    @property
+    def counts(self) -> sp.csr_matrix:
+        """All profiles' term counts as one (profiles, features) matrix"""
+        if self._stacked is None:
+            self._stacked = sp.vstack(self._counts, format='csr')
+        return self._stacked
+
+    def ingest(self, jobs: Iterable[Dict], threshold: float = DEFAULT_ALERT_THRESHOLD) -> List[Dict]:
+        """Apply a feed of postings and return the new posting/profile matches at or above threshold"""
+        alerts = []
+        self.matcher.apply_updates(jobs, on_added=lambda rows: alerts.extend(self.match_rows(rows, threshold)))
+        return alerts
+
+    def match_rows(self, rows: slice, threshold: float = DEFAULT_ALERT_THRESHOLD) -> List[Dict]:
+        """Score a range of job rows against every saved profile"""
+        index, semantic = self.matcher.index, self.matcher.semantic
+        if not self.profile_ids or rows.start >= rows.stop:
+            return []
+
+        # Weighted under the index's current IDF, as the single-resume path does
+        if semantic is not None:
+            semantic.sync(index)
+            latent = semantic.project(index.weight_counts(self.counts))
+        else:
+            queries = index.query_counts(self.counts)
+        norms, required, active = index.row_norms(), index.required_counts, index.active
+        profile_skills = skill_indicator(self._skill_ids, len(index.skill_vocab))
+        chunk = max(1, self.memory_limit // (BATCH_BYTES_PER_CELL * len(self.profile_ids)))
+
+        alerts = []
+        for start in range(rows.start, rows.stop, chunk):
+            jobs = slice(start, min(start + chunk, rows.stop))
+            if semantic is not None:
+                similarity = np.stack([semantic.scores(vector, jobs) for vector in latent], axis=1)
+            else:
+                similarity = (index.matrix[jobs] @ queries.T).toarray()
+                if norms is not None:
+                    similarity /= norms[jobs, None]
+            matching = (index.skill_indicator(jobs) @ profile_skills.T).toarray()
+            skill_match = np.divide(matching, required[jobs, None], out=np.zeros(matching.shape),
+                                    where=required[jobs, None] > 0)
+            tenths = match_score_tenths(similarity, skill_match)
+            tenths[~active[jobs]] = -1
+
+            for offset, profile_row in zip(*np.nonzero(tenths >= round(threshold * 10))):
+                resume_bits = index.skill_vocab.pack(self._skill_ids[profile_row])
+                alerts.append({
+                    'profile_id': self.profile_ids[profile_row],
+                    **self.matcher._build_match(start + offset, tenths[offset, profile_row],
+                                                similarity[offset, profile_row], skill_match[offset, profile_row],
+                                                resume_bits)
+                })
+        return alerts
+
+    def save(self, path: str):
+        """Write the profiles to a directory"""
+        os.makedirs(path, exist_ok=True)
+        index = self.matcher.index
+        counts = self.counts if self.profile_ids else sp.csr_matrix((0, index.n_features))
+        sp.save_npz(os.path.join(path, PROFILE_COUNTS_FILE), counts)
+        with open(os.path.join(path, PROFILES_FILE), 'w', encoding='utf-8') as handle:
+            json.dump({
+                'index_type': type(index).__name__,
+                'n_features': index.n_features,
+                'profile_ids': self.profile_ids,
+                # Names rather than ids, so a store outlives the vocabulary it was built with
+                'skills': [[index.skill_vocab.names[skill_id] for skill_id in ids] for ids in self._skill_ids]
+            }, handle)
+
+    @classmethod
+    def load(cls, path: str, matcher: JobMatcher, memory_limit: int = DEFAULT_BATCH_MEMORY) -> 'ProfileStore':
+        """Open saved profiles against a matcher whose index uses the same feature space"""
+        with open(os.path.join(path, PROFILES_FILE), encoding='utf-8') as handle:
+            saved = json.load(handle)
+        index = matcher.index
+        if saved['index_type'] != type(index).__name__ or saved['n_features'] != index.n_features:
+            raise Exception(f"Profiles in {path} were saved for a different job index")
+        store = cls(matcher, memory_limit)
+        counts = sp.load_npz(os.path.join(path, PROFILE_COUNTS_FILE)).tocsr()
+        for row, (profile_id, skills) in enumerate(zip(saved['profile_ids'], saved['skills'])):
+            store._store(profile_id, counts[row], index.skill_vocab.encode(skills, add=True))
+        return store
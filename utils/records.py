@@ -0,0 +1,163 @@
+from array import array
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from utils.skill_matcher import SkillMatcher
+
+
+@dataclass(slots=True)
+class SectionSpan:
+    """A section as character offsets into the record's text.
+
+    ``title_start`` is -1 for the implicit leading "Summary" section.
+    """
+    title_start: int
+    title_end: int
+    start: int
+    end: int
+
+
+@dataclass(slots=True)
+class ExperienceEntry:
+    """An experience line and its date range, both as offsets"""
+    line_start: int
+    line_end: int
+    duration_start: int
+    duration_end: int
+    company: str
+
+
+@dataclass(slots=True)
+class EducationEntry:
+    """An education line as offsets, plus its (interned) degree"""
+    line_start: int
+    line_end: int
+    degree: str
+
+
+@dataclass(slots=True)
+class ResumeRecord:
+    """Compact parsed resume for keeping large batches in memory.
+
+    Everything textual is an offset into the single ``text`` buffer, skills
+    are ids into the parser's skill automaton and person names are
+    interned, so no string is stored twice. ``view()`` gives the familiar
+    ``analyze_text`` dict shape, computed field by field on access. The
+    job matcher reads the interned ``terms`` and their counts instead of
+    tokenizing ``text`` again.
+    """
+    text: str
+    skill_ids: array
+    sections: Tuple[SectionSpan, ...]
+    experience: Tuple[ExperienceEntry, ...]
+    education: Tuple[EducationEntry, ...]
+    personal_info: Tuple[Tuple[str, Optional[str]], ...]
+    word_count: int
+    sentence_count: int
+    unique_words: int
+    persons: Tuple[str, ...]
+    person_counts: array
+    terms: Tuple[str, ...]
+    term_counts: array
+    skill_matcher: SkillMatcher = field(repr=False, compare=False)
+    error: Optional[str] = None
+
+    def skills(self) -> Dict[str, List[str]]:
+        found_skills = {category: [] for category in self.skill_matcher.categories}
+        for skill_id in self.skill_ids:
+            category, skill = self.skill_matcher.patterns[skill_id]
+            found_skills[category].append(skill)
+        return found_skills
+
+    def section_texts(self) -> Dict[str, str]:
+        text = self.text
+        sections = {}
+        for span in self.sections:
+            title = text[span.title_start:span.title_end] if span.title_start >= 0 else "Summary"
+            # Lines inside a section are joined with spaces, as in extract_sections
+            sections[title] = text[span.start:span.end].replace('\n', ' ')
+        return sections
+
+    def experience_entries(self) -> List[Dict]:
+        text = self.text
+        return [{
+            'duration': text[entry.duration_start:entry.duration_end],
+            'position': text[entry.line_start:entry.line_end],
+            'company': entry.company
+        } for entry in self.experience]
+
+    def education_entries(self) -> List[Dict]:
+        text = self.text
+        return [{
+            'institution': text[entry.line_start:entry.line_end],
+            'degree': entry.degree
+        } for entry in self.education]
+
+    def stats(self) -> Dict:
+        return {
+            'word_count': self.word_count,
+            'sentence_count': self.sentence_count,
+            'avg_sentence_length': self.word_count / self.sentence_count if self.sentence_count else 0,
+            'unique_words': self.unique_words
+        }
+
+    def entities(self) -> Dict:
+        persons = list(self.persons)
+        return {
+            'organizations': [],
+            'persons': persons,
+            'locations': [],
+            'person_counts': dict(zip(persons, self.person_counts))
+        }
+
+    def term_count_lists(self) -> Dict[str, List]:
+        return {'terms': list(self.terms), 'counts': list(self.term_counts)}
+
+    def view(self) -> 'ResumeRecordView':
+        return ResumeRecordView(self)
+
+    def to_dict(self) -> Dict:
+        return dict(self.view())
+
+
+class ResumeRecordView(Mapping):
+    """Read-only, lazily computed dict view of a ResumeRecord"""
+    __slots__ = ('record', '_cache')
+
+    _FIELDS = {
+        'raw_text': lambda record: record.text,
+        'personal_info': lambda record: dict(record.personal_info),
+        'skills': ResumeRecord.skills,
+        'experience': ResumeRecord.experience_entries,
+        'education': ResumeRecord.education_entries,
+        'sections': ResumeRecord.section_texts,
+        'stats': ResumeRecord.stats,
+        'entities': ResumeRecord.entities,
+        'term_counts': ResumeRecord.term_count_lists
+    }
+
+    def __init__(self, record: ResumeRecord):
+        self.record = record
+        self._cache = {}
+
+    def _keys(self) -> List[str]:
+        keys = list(self._FIELDS)
+        if self.record.error is not None:
+            keys.insert(0, 'error')
+        return keys
+
+    def __getitem__(self, key: str):
+        if key == 'error' and self.record.error is not None:
+            return self.record.error
+        if key not in self._FIELDS:
+            raise KeyError(key)
+        if key not in self._cache:
+            self._cache[key] = self._FIELDS[key](self.record)
+        return self._cache[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys())
+
+    def __len__(self) -> int:
+        return len(self._keys())
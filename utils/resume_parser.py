@@ -1,12 +1,125 @@
-import pdfplumber
-import docx
+import hashlib
+import io
+import json
+import os
 import re
-from typing import Dict, List, Optional
+import sys
+import zipfile
+import xml.etree.ElementTree as ET
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+from utils.docx_reader import extract_docx_text
+from utils.document import ResumeDocument
+from utils.extraction_rules import RuleEngine
+from utils.parse_cache import ParseCache
+from utils.pdf_backends import PDF_BACKEND_MODES, get_pdf_backend, looks_garbled
+from utils.records import EducationEntry, ExperienceEntry, ResumeRecord, SectionSpan
+from utils.skill_matcher import SkillMatcher
+
+TITLE_WORDS_PATTERN = re.compile(r'\b(senior|junior|lead|manager|director|engineer|developer|analyst)\b', re.IGNORECASE)
+ENTITY_PATTERN = re.compile(r'[A-Z][a-z]+')
+SENTENCE_SPLIT_PATTERN = re.compile(r'[.!?]+')
+
+# Bump when extraction logic changes so cached parse results are invalidated
+PARSER_VERSION = "7"
+
+# Page and character budgets keep one huge upload from monopolising a worker
+DEFAULT_MAX_PAGES = 50
+DEFAULT_MAX_CHARS = 200_000
+# Long PDFs are split into page ranges of this size for the process pool
+PAGES_PER_TASK = 8
+
+# A resume can be a path on disk or the raw upload bytes held in memory
+ResumeSource = Union[str, os.PathLike, bytes, bytearray, memoryview, BinaryIO]
+
+_page_pool = None
+
+
+def _get_page_pool(workers: Optional[int]) -> ProcessPoolExecutor:
+    """Process pool shared by all parsers for page-parallel PDF extraction"""
+    global _page_pool
+    if _page_pool is None:
+        _page_pool = ProcessPoolExecutor(max_workers=workers or os.cpu_count())
+    return _page_pool
+
+
+def _extract_pdf_page_range(source: Union[str, bytes], start: int, stop: int, backend_name: str) -> List[str]:
+    """Extract the text of pages [start, stop) in a worker process"""
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    backend = get_pdf_backend(backend_name)
+    with backend.open(source) as doc:
+        return [backend.extract_page(doc, index) for index in range(start, stop)]
+
+
+def open_source(source: ResumeSource) -> Union[str, BinaryIO]:
+    """Return a path or a rewound binary stream, without copying to disk"""
+    if isinstance(source, (str, os.PathLike)):
+        return os.fspath(source)
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(source)
+    source.seek(0)
+    return source
+
+
+def read_source_bytes(source: ResumeSource) -> bytes:
+    """Load the full file content, e.g. for hashing"""
+    source = open_source(source)
+    if isinstance(source, str):
+        with open(source, 'rb') as handle:
+            return handle.read()
+    data = source.read()
+    source.seek(0)
+    return data
+
+
+def detect_file_type(source: ResumeSource) -> Optional[str]:
+    """Infer 'pdf' or 'docx' from the file's magic bytes"""
+    source = open_source(source)
+    if isinstance(source, str):
+        with open(source, 'rb') as handle:
+            return detect_file_type(io.BytesIO(handle.read()))
+
+    header = source.read(1024)
+    source.seek(0)
+    if b'%PDF-' in header:
+        return "pdf"
+    if header.startswith(b'PK\x03\x04'):
+        try:
+            with zipfile.ZipFile(source) as archive:
+                is_docx = 'word/document.xml' in archive.namelist()
+        except zipfile.BadZipFile:
+            is_docx = False
+        finally:
+            source.seek(0)
+        if is_docx:
+            return "docx"
+    return None
+
 
 class ResumeParser:
-    def __init__(self):
+    def __init__(self, technical_skills: Optional[Dict[str, List[str]]] = None,
+                 rules_path: Optional[str] = None,
+                 max_pages: Optional[int] = DEFAULT_MAX_PAGES,
+                 max_chars: Optional[int] = DEFAULT_MAX_CHARS,
+                 parallel_page_threshold: Optional[int] = None,
+                 page_workers: Optional[int] = None,
+                 cache: Optional[ParseCache] = None,
+                 pdf_backend: str = 'auto'):
+        # Budgets for PDF extraction; None means unlimited
+        self.max_pages = max_pages
+        self.max_chars = max_chars
+        # PDFs with at least this many pages are fanned out to a process pool
+        self.parallel_page_threshold = parallel_page_threshold
+        self.page_workers = page_workers
+        # 'fast' (PyPDF2 text stream), 'layout' (pdfplumber) or 'auto' (fast, layout if garbled)
+        if pdf_backend not in PDF_BACKEND_MODES:
+            raise ValueError(f"Unknown PDF backend: {pdf_backend!r}")
+        self.pdf_backend = pdf_backend
+
         # Enhanced skill keywords
-        self.technical_skills = {
+        self.technical_skills = technical_skills or {
             'programming': ['python', 'java', 'javascript', 'c++', 'c#', 'ruby', 'go', 'rust', 'swift', 'kotlin'],
             'web': ['html', 'css', 'react', 'angular', 'vue', 'django', 'flask', 'node.js', 'express'],
             'data_science': ['pandas', 'numpy', 'scikit-learn', 'tensorflow', 'pytorch', 'keras', 'ml', 'ai'],
@@ -14,6 +127,11 @@ class ResumeParser:
             'cloud': ['aws', 'azure', 'gcp', 'docker', 'kubernetes', 'terraform'],
             'tools': ['git', 'jenkins', 'jira', 'confluence', 'slack']
         }
+        # Compiled once per parser; matching cost no longer grows with the taxonomy
+        self.skill_matcher = SkillMatcher(self.technical_skills)
+        # Emails, phones, date ranges, headers etc. come from one rule-table scan
+        self.rules = RuleEngine.from_file(rules_path)
+        self.cache = cache
         
         self.education_keywords = ['university', 'college', 'institute', 'bachelor', 'master', 'phd', 'degree']
         self.stop_words = {'i', 'me', 'my', 'myself', 'we', 'our', 'ours', 'ourselves', 'you', "you're", "you've", 
@@ -25,42 +143,120 @@ class ResumeParser:
                           'because', 'as', 'until', 'while', 'of', 'at', 'by', 'for', 'with', 'about', 'against', 
                           'between', 'into', 'through', 'during', 'before', 'after', 'above', 'below', 'to', 'from', 
                           'up', 'down', 'in', 'out', 'on', 'off', 'over', 'under', 'again', 'further', 'then', 'once'}
+        self.version = self._compute_version()
+
+    def _compute_version(self) -> str:
+        """Fingerprint of everything that shapes a parse result"""
+        fingerprint = json.dumps([
+            PARSER_VERSION, self.technical_skills, self.rules.rules, self.education_keywords,
+            self.max_pages, self.max_chars, self.pdf_backend
+        ], sort_keys=True)
+        return f"{PARSER_VERSION}-{hashlib.sha256(fingerprint.encode('utf-8')).hexdigest()[:16]}"
+
+    def iter_pdf_pages(self, source: ResumeSource, backend_name: str = 'layout') -> Iterator[str]:
+        """Yield page texts in order from one backend, stopping at the page budget"""
+        backend = get_pdf_backend(backend_name)
+        source = open_source(source)
+        with backend.open(source) as doc:
+            page_count = backend.page_count(doc)
+            if self.max_pages is not None:
+                page_count = min(page_count, self.max_pages)
+
+            threshold = self.parallel_page_threshold
+            if threshold is None or page_count < threshold:
+                for index in range(page_count):
+                    yield backend.extract_page(doc, index)
+                return
 
-    def extract_text_from_pdf(self, file_path: str) -> str:
-        """Extract text from PDF file"""
-        text = ""
+        if not isinstance(source, str):
+            # Workers get their own copy of the bytes to reopen the document
+            source.seek(0)
+            source = source.read()
+        pool = _get_page_pool(self.page_workers)
+        futures = [
+            pool.submit(_extract_pdf_page_range, source, start, min(start + PAGES_PER_TASK, page_count), backend_name)
+            for start in range(0, page_count, PAGES_PER_TASK)
+        ]
+        try:
+            for future in futures:
+                yield from future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def extract_text_from_pdf(self, source: ResumeSource) -> str:
+        """Extract text from PDF file with the configured backend"""
         try:
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text() or ""
-                    text += page_text + "\n"
+            if self.pdf_backend != 'auto':
+                return self._extract_pdf_with(source, self.pdf_backend)
+            # Most resumes are simple single-column PDFs; only pay for layout when needed
+            try:
+                text = self._extract_pdf_with(source, 'fast')
+            except Exception:
+                text = ""
+            if not looks_garbled(text):
+                return text
+            return self._extract_pdf_with(source, 'layout')
         except Exception as e:
             raise Exception(f"Error reading PDF: {str(e)}")
-        return text.strip()
 
-    def extract_text_from_docx(self, file_path: str) -> str:
-        """Extract text from DOCX file"""
-        text = ""
+    def _extract_pdf_with(self, source: ResumeSource, backend_name: str) -> str:
+        """Run one backend over the pages within the page and character budgets"""
+        parts = []
+        remaining = self.max_chars
+        pages = self.iter_pdf_pages(source, backend_name)
         try:
-            doc = docx.Document(file_path)
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    text += paragraph.text + "\n"
+            for page_text in pages:
+                if remaining is not None:
+                    page_text = page_text[:remaining]
+                    remaining -= len(page_text)
+                parts.append(page_text)
+                if remaining is not None and remaining <= 0:
+                    break
+        finally:
+            pages.close()
+        return "\n".join(parts).strip()
+
+    def extract_text_from_docx(self, source: ResumeSource) -> str:
+        """Extract text from DOCX file, including tables, text boxes, headers and footers"""
+        try:
+            try:
+                # Stream the XML parts straight from the zip
+                return extract_docx_text(open_source(source)).strip()
+            except (KeyError, ET.ParseError):
+                # Unusual package layout; let python-docx resolve the parts
+                return self._extract_text_from_docx_model(source)
         except Exception as e:
             raise Exception(f"Error reading DOCX: {str(e)}")
-        return text.strip()
 
-    def parse_resume(self, file_path: str, file_type: str) -> Dict:
-        """Main method to parse resume and extract information"""
+    def _extract_text_from_docx_model(self, source: ResumeSource) -> str:
+        """Extract paragraph text through the python-docx object model"""
+        import docx  # Only needed for the fallback path; slow to import
+        doc = docx.Document(open_source(source))
+        return "\n".join(paragraph.text for paragraph in doc.paragraphs if paragraph.text.strip())
+
+    def parse_resume(self, source: ResumeSource, file_type: Optional[str] = None) -> Dict:
+        """Main method to parse resume and extract information
+
+        ``source`` may be a file path or the upload itself as bytes, a
+        memoryview or a binary stream; in-memory input never touches disk.
+        The file type is inferred from magic bytes when not given.
+        Results are served from ``self.cache`` when the same bytes were parsed
+        before by a parser with the same version.
+        """
         try:
-            if file_type == "pdf":
-                text = self.extract_text_from_pdf(file_path)
-            elif file_type == "docx":
-                text = self.extract_text_from_docx(file_path)
-            else:
-                raise ValueError("Unsupported file format")
-
-            return self.analyze_text(text)
+            cache_key = None
+            if self.cache is not None:
+                source = read_source_bytes(source)
+                cache_key = ParseCache.make_key(source, self.version)
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
+            result = self.analyze_text(self._extract_text(source, file_type))
+            if cache_key is not None and 'error' not in result:
+                self.cache.put(cache_key, result)
+            return result
         except Exception as e:
             return {
                 'error': f"Error processing resume: {str(e)}",
@@ -71,12 +267,100 @@ class ResumeParser:
                 'education': [],
                 'sections': {},
                 'stats': {},
-                'entities': {}
+                'entities': {},
+                'term_counts': {'terms': [], 'counts': []}
             }
 
+    def _extract_text(self, source: ResumeSource, file_type: Optional[str]) -> str:
+        """Pick the extractor for the file type"""
+        file_type = file_type or detect_file_type(source)
+        if file_type == "pdf":
+            return self.extract_text_from_pdf(source)
+        elif file_type == "docx":
+            return self.extract_text_from_docx(source)
+        raise ValueError("Unsupported file format")
+
+    def parse_record(self, source: ResumeSource, file_type: Optional[str] = None) -> ResumeRecord:
+        """Like parse_resume, but returns a compact ResumeRecord"""
+        try:
+            return self.analyze_record(self._extract_text(source, file_type))
+        except Exception as e:
+            return self._empty_record(f"Error processing resume: {str(e)}")
+
+    def _empty_record(self, error: str) -> ResumeRecord:
+        return ResumeRecord(
+            text='', skill_ids=array('I'), sections=(), experience=(), education=(), personal_info=(),
+            word_count=0, sentence_count=0, unique_words=0, persons=(), person_counts=array('I'),
+            terms=(), term_counts=array('I'), skill_matcher=self.skill_matcher, error=error
+        )
+
+    def analyze_record(self, text: str) -> ResumeRecord:
+        """Analyze text into a compact record of offsets and ids instead of nested dicts"""
+        doc = ResumeDocument(text or '')
+        if not doc:
+            return self._empty_record("No text extracted from resume")
+
+        def line_end(index: int) -> int:
+            return doc.offsets[index] + len(doc.lines[index])
+
+        sections = tuple(
+            SectionSpan(
+                title_start=doc.offsets[header] if header >= 0 else -1,
+                title_end=line_end(header) if header >= 0 else -1,
+                start=doc.offsets[start],
+                end=line_end(end - 1)
+            )
+            for header, start, end in self.section_spans(doc)
+        )
+        experience = tuple(
+            ExperienceEntry(
+                line_start=doc.offsets[index],
+                line_end=line_end(index),
+                duration_start=match.start(),
+                duration_end=match.end(),
+                company=self.extract_company_name(doc.lines[index])
+            )
+            for index, match in self.experience_matches(doc)
+        )
+        education = tuple(
+            EducationEntry(
+                line_start=doc.offsets[index],
+                line_end=line_end(index),
+                degree=sys.intern(self.extract_degree(doc.lines[index]))
+            )
+            for index in self.education_lines(doc)
+        )
+
+        stats = self.calculate_stats(doc)
+        persons, person_counts = [], array('I')
+        for word, count in doc.tokens.counted():
+            if self._is_person_token(word):
+                persons.append(sys.intern(word))
+                person_counts.append(count)
+        term_counts = doc.tokens.term_counts()
+
+        return ResumeRecord(
+            text=doc.text,
+            skill_ids=array('I', self.skill_matcher.find_ids(doc.text_lower)),
+            sections=sections,
+            experience=experience,
+            education=education,
+            personal_info=tuple(self.extract_personal_info(doc).items()),
+            word_count=stats['word_count'],
+            sentence_count=stats['sentence_count'],
+            unique_words=stats['unique_words'],
+            persons=tuple(persons),
+            person_counts=person_counts,
+            terms=tuple(term_counts['terms']),
+            term_counts=array('I', term_counts['counts']),
+            skill_matcher=self.skill_matcher
+        )
+
     def analyze_text(self, text: str) -> Dict:
         """Analyze extracted text and structure information"""
-        if not text:
+        # Split, clean and lowercase once; every extractor shares this document
+        doc = ResumeDocument(text or '')
+        if not doc:
             return {
                 'error': "No text extracted from resume",
                 'raw_text': '',
@@ -86,128 +370,134 @@ class ResumeParser:
                 'education': [],
                 'sections': {},
                 'stats': {},
-                'entities': {}
+                'entities': {},
+                'term_counts': {'terms': [], 'counts': []}
             }
 
-        # Clean text
-        text = re.sub(r'\s+', ' ', text).strip()
-        
         return {
-            'raw_text': text,
-            'personal_info': self.extract_personal_info(text),
-            'skills': self.extract_skills(text),
-            'experience': self.extract_experience(text),
-            'education': self.extract_education(text),
-            'sections': self.extract_sections(text),
-            'stats': self.calculate_stats(text),
-            'entities': self.extract_entities(text)
+            'raw_text': doc.text,
+            'personal_info': self.extract_personal_info(doc),
+            'skills': self.extract_skills(doc),
+            'experience': self.extract_experience(doc),
+            'education': self.extract_education(doc),
+            'sections': self.extract_sections(doc),
+            'stats': self.calculate_stats(doc),
+            'entities': self.extract_entities(doc),
+            'term_counts': doc.tokens.term_counts()
         }
 
-    def extract_sections(self, text: str) -> Dict:
+    @staticmethod
+    def _document(doc: Union[str, ResumeDocument]) -> ResumeDocument:
+        """Accept raw text for callers that use an extractor on its own"""
+        return doc if isinstance(doc, ResumeDocument) else ResumeDocument(doc)
+
+    def _matches(self, doc: ResumeDocument) -> Dict[str, List[re.Match]]:
+        """Rule matches for a document, scanned at most once"""
+        if doc.matches is None:
+            doc.matches = self.rules.scan(doc.text)
+        return doc.matches
+
+    def extract_sections(self, doc: Union[str, ResumeDocument]) -> Dict:
         """Identify and extract resume sections"""
+        doc = self._document(doc)
         sections = {}
-        lines = text.split('\n')
         
-        current_section = "Summary"
-        section_content = []
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            if self.is_section_header(line):
-                if current_section and section_content:
-                    sections[current_section] = ' '.join(section_content)
-                current_section = line
-                section_content = []
-            else:
-                section_content.append(line)
-        
-        if current_section and section_content:
-            sections[current_section] = ' '.join(section_content)
+        for header, start, end in self.section_spans(doc):
+            title = doc.lines[header] if header >= 0 else "Summary"
+            sections[title] = ' '.join(doc.lines[start:end])
             
         return sections
 
+    def section_spans(self, doc: ResumeDocument) -> List[Tuple[int, int, int]]:
+        """(header line, first line, end line) of every non-empty section; header -1 is the Summary"""
+        header_lines = {doc.line_at(match.start()) for match in self._matches(doc)['section_header']}
+        spans = []
+        current_header = -1
+        start = 0
+        
+        for index in range(len(doc.lines)):
+            if index in header_lines:
+                if index > start:
+                    spans.append((current_header, start, index))
+                current_header = index
+                start = index + 1
+        
+        if len(doc.lines) > start:
+            spans.append((current_header, start, len(doc.lines)))
+        return spans
+
     def is_section_header(self, line: str) -> bool:
         """Check if a line is likely a section header"""
-        header_patterns = [
-            r'^(experience|work experience|employment history)',
-            r'^(education|academic background)',
-            r'^(skills|technical skills|competencies)',
-            r'^(projects|personal projects)',
-            r'^(certifications|certificates)',
-            r'^(achievements|awards)',
-            r'^(summary|objective|about)'
-        ]
-        
-        line_lower = line.lower().strip()
-        return any(re.match(pattern, line_lower) for pattern in header_patterns)
+        return self.rules.match('section_header', line.strip()) is not None
 
-    def extract_personal_info(self, text: str) -> Dict:
+    def extract_personal_info(self, doc: Union[str, ResumeDocument]) -> Dict:
         """Extract personal information"""
-        emails = re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
-        phones = re.findall(r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', text)
-        linkedin = re.findall(r'(https?://)?(www\.)?linkedin\.com/in/[A-Za-z0-9-]+', text)
+        matches = self._matches(self._document(doc))
         
+        # Every rule targeting personal_info contributes its first match
         return {
-            'email': emails[0] if emails else None,
-            'phone': phones[0] if phones else None,
-            'linkedin': linkedin[0] if linkedin else None
+            name: matches[name][0].group() if matches[name] else None
+            for name in self.rules.names_for_target('personal_info')
         }
 
-    def extract_skills(self, text: str) -> Dict:
-        """Extract skills from resume text"""
-        text_lower = text.lower()
-        found_skills = {}
-        
-        for category, skills in self.technical_skills.items():
-            found_skills[category] = []
-            for skill in skills:
-                if skill in text_lower:
-                    found_skills[category].append(skill)
-        
-        return found_skills
+    def extract_skills(self, doc: Union[str, ResumeDocument]) -> Dict:
+        """Extract skills from resume text in a single pass"""
+        return self.skill_matcher.find(self._document(doc).text_lower)
 
-    def extract_experience(self, text: str) -> List[Dict]:
+    def extract_experience(self, doc: Union[str, ResumeDocument]) -> List[Dict]:
         """Extract work experience information"""
+        doc = self._document(doc)
         experience = []
-        lines = text.split('\n')
         
-        for i, line in enumerate(lines):
-            line = line.strip()
-            duration_match = re.search(r'\b(\d{4})\s*[-–]\s*(\d{4}|present|current)\b', line, re.IGNORECASE)
-            if duration_match:
-                exp_entry = {
-                    'duration': duration_match.group(),
-                    'position': line,
-                    'company': self.extract_company_name(line)
-                }
-                experience.append(exp_entry)
+        for index, duration_match in self.experience_matches(doc):
+            line = doc.lines[index]
+            exp_entry = {
+                'duration': duration_match.group(),
+                'position': line,
+                'company': self.extract_company_name(line)
+            }
+            experience.append(exp_entry)
         
         return experience
 
+    def experience_matches(self, doc: ResumeDocument) -> List[Tuple[int, re.Match]]:
+        """Line index and first date-range match of every experience line"""
+        entries = []
+        seen_lines = set()
+        for duration_match in self._matches(doc)['date_range']:
+            index = doc.line_at(duration_match.start())
+            if index not in seen_lines:
+                seen_lines.add(index)
+                entries.append((index, duration_match))
+        return entries
+
     def extract_company_name(self, line: str) -> str:
         """Extract company name from experience line"""
-        cleaned = re.sub(r'\b(\d{4})\s*[-–]\s*(\d{4}|present|current)\b', '', line)
-        cleaned = re.sub(r'\b(senior|junior|lead|manager|director|engineer|developer|analyst)\b', '', cleaned, flags=re.IGNORECASE)
+        cleaned = self.rules.patterns['date_range'].sub('', line)
+        cleaned = TITLE_WORDS_PATTERN.sub('', cleaned)
         return cleaned.strip()
 
-    def extract_education(self, text: str) -> List[Dict]:
+    def extract_education(self, doc: Union[str, ResumeDocument]) -> List[Dict]:
         """Extract education information"""
+        doc = self._document(doc)
         education = []
-        lines = text.split('\n')
         
-        for line in lines:
-            line_lower = line.lower()
-            if any(keyword in line_lower for keyword in self.education_keywords):
-                education.append({
-                    'institution': line,
-                    'degree': self.extract_degree(line)
-                })
+        for index in self.education_lines(doc):
+            line = doc.lines[index]
+            education.append({
+                'institution': line,
+                'degree': self.extract_degree(line)
+            })
         
         return education
 
+    def education_lines(self, doc: ResumeDocument) -> List[int]:
+        """Indices of lines mentioning an education keyword"""
+        return [
+            index for index, line_lower in enumerate(doc.lines_lower)
+            if any(keyword in line_lower for keyword in self.education_keywords)
+        ]
+
     def extract_degree(self, line: str) -> str:
         """Extract degree information from education line"""
         degrees = ['bachelor', 'master', 'phd', 'associate', 'diploma', 'certificate']
@@ -218,32 +508,40 @@ class ResumeParser:
                 return degree.capitalize()
         return "Unknown"
 
-    def extract_entities(self, text: str) -> Dict:
+    def extract_entities(self, doc: Union[str, ResumeDocument]) -> Dict:
         """Extract named entities using regex and simple rules"""
+        tokens = self._document(doc).tokens
         entities = {
             'organizations': [],
             'persons': [],
-            'locations': []
+            'locations': [],
+            'person_counts': {}
         }
         
-        # Simple entity extraction using capitalization rules
-        words = re.findall(r'\b[A-Z][a-z]+\b', text)
-        for word in words:
-            if word.lower() not in self.stop_words and len(word) > 1:
-                if word.istitle() and not any(char.isdigit() for char in word):
-                    entities['persons'].append(word)
+        # Simple entity extraction using capitalization rules; each name once, with its count
+        for word, count in tokens.counted():
+            if self._is_person_token(word):
+                # Names recur across resumes; interned, a batch holds each one once
+                word = sys.intern(word)
+                entities['persons'].append(word)
+                entities['person_counts'][word] = count
         
         return entities
 
-    def calculate_stats(self, text: str) -> Dict:
+    def _is_person_token(self, word: str) -> bool:
+        """Capitalized, non-stop-word tokens are treated as person names"""
+        return ENTITY_PATTERN.fullmatch(word) is not None and word.lower() not in self.stop_words
+
+    def calculate_stats(self, doc: Union[str, ResumeDocument]) -> Dict:
         """Calculate resume statistics using simple string methods"""
-        words = re.findall(r'\b\w+\b', text)
-        sentences = re.split(r'[.!?]+', text)
+        doc = self._document(doc)
+        tokens = doc.tokens
+        sentences = SENTENCE_SPLIT_PATTERN.split(doc.text)
         sentences = [s.strip() for s in sentences if s.strip()]
         
         return {
-            'word_count': len(words),
+            'word_count': len(tokens),
             'sentence_count': len(sentences),
-            'avg_sentence_length': len(words) / len(sentences) if sentences else 0,
-            'unique_words': len(set(words))
+            'avg_sentence_length': len(tokens) / len(sentences) if sentences else 0,
+            'unique_words': tokens.unique_count
         }
@@ -0,0 +1,110 @@
+import os
+from typing import Dict
+
+import numpy as np
+import scipy.sparse as sp
+
+from utils.job_index import JobIndex
+
+DEFAULT_COMPONENTS = 256
+VECTORS_FILE = 'job_vectors.npy'
+COMPONENTS_FILE = 'components.npy'
+TERMS_FILE = 'terms.npy'
+
+
+def _normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (vectors / norms).astype(np.float32)
+
+
+class SemanticIndex:
+    """Latent semantic job vectors from a truncated SVD of the job TF-IDF rows.
+
+    The projection is fitted offline; matching is then one dense float32 dot
+    product per resume instead of a sparse product over the whole
+    vocabulary. Fitted job vectors are stored in a ``.npy`` file opened as a
+    read-only memory map, so worker processes share one copy through the
+    page cache. Rows the job index gains after fitting are projected on
+    demand, and a compaction of the index re-projects every row in memory.
+    """
+
+    def __init__(self, terms: np.ndarray, components: np.ndarray, vectors: np.ndarray, generation: int = 0):
+        # Index columns the projection reads; hashing indexes leave most columns empty
+        self.terms = terms
+        self.components = components
+        self.vectors = vectors
+        self.appended = np.empty((0, components.shape[0]), dtype=np.float32)
+        self.generation = generation
+
+    @classmethod
+    def fit(cls, index: JobIndex, path: str, n_components: int = DEFAULT_COMPONENTS,
+            random_state: int = 0) -> 'SemanticIndex':
+        """Fit on the live rows of a job index and write the projection and vectors to a directory"""
+        from sklearn.decomposition import TruncatedSVD
+        weighted = index.weighted_matrix()
+        live = weighted[np.flatnonzero(index.active)]
+        terms = np.flatnonzero(live.getnnz(axis=0))
+        live = live[:, terms]
+        n_components = max(1, min(n_components, *live.shape))
+        svd = TruncatedSVD(n_components=n_components, random_state=random_state).fit(live)
+
+        components = svd.components_.astype(np.float32)
+        semantic = cls(terms, components, np.empty((0, n_components), dtype=np.float32))
+        semantic.appended = semantic.project(weighted)
+        semantic.save(path)
+        return cls.load(path, generation=index.generation)
+
+    def save(self, path: str):
+        """Write the projection and all job vectors to a directory"""
+        os.makedirs(path, exist_ok=True)
+        np.save(os.path.join(path, TERMS_FILE), self.terms)
+        np.save(os.path.join(path, COMPONENTS_FILE), self.components)
+        vectors = np.lib.format.open_memmap(os.path.join(path, VECTORS_FILE), mode='w+', dtype=np.float32,
+                                            shape=(self.n_rows, self.components.shape[0]))
+        fitted = len(self.vectors)
+        vectors[:fitted] = self.vectors
+        vectors[fitted:] = self.appended
+        vectors.flush()
+        del vectors
+
+    @classmethod
+    def load(cls, path: str, generation: int = 0) -> 'SemanticIndex':
+        """Open a fitted index; job vectors are memory-mapped rather than read"""
+        return cls(np.load(os.path.join(path, TERMS_FILE)),
+                   np.load(os.path.join(path, COMPONENTS_FILE)),
+                   np.load(os.path.join(path, VECTORS_FILE), mmap_mode='r'),
+                   generation)
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.vectors) + len(self.appended)
+
+    def project(self, weighted: sp.csr_matrix) -> np.ndarray:
+        """Unit-length latent vectors for rows in the index's TF-IDF space"""
+        return _normalize_rows(weighted[:, self.terms] @ self.components.T)
+
+    def sync(self, index: JobIndex):
+        """Bring the vectors in line with the index's current rows"""
+        if index.generation != self.generation:
+            self.vectors = self.project(index.weighted_matrix())
+            self.appended = self.appended[:0]
+            self.generation = index.generation
+        elif self.n_rows < len(index.jobs):
+            new_rows = self.project(index.weighted_matrix(slice(self.n_rows, None)))
+            self.appended = np.concatenate([self.appended, new_rows])
+
+    def query(self, index: JobIndex, term_counts: Dict[str, int]) -> np.ndarray:
+        """Latent vector of a resume"""
+        return self.project(index.transform(term_counts))[0]
+
+    def scores(self, latent: np.ndarray, rows: slice = slice(None)) -> np.ndarray:
+        """Cosine similarity of a latent resume vector with a range of job rows, floored at 0"""
+        start, stop, _ = rows.indices(self.n_rows)
+        fitted = len(self.vectors)
+        parts = []
+        if start < fitted:
+            parts.append(self.vectors[start:min(stop, fitted)] @ latent)
+        if stop > fitted:
+            parts.append(self.appended[max(start - fitted, 0):stop - fitted] @ latent)
+        return np.maximum(np.concatenate(parts), 0)
@@ -0,0 +1,70 @@
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+# Number of set bits in every possible byte, for popcounts over packed rows
+POPCOUNT_TABLE = np.array([bin(value).count('1') for value in range(256)], dtype=np.uint8)
+
+
+class SkillVocabulary:
+    """Append-only mapping of lowercased skill names to bit positions.
+
+    Ids are never reused or reordered, so a bitset packed against an older,
+    smaller vocabulary stays valid once padded to the current width.
+    """
+
+    def __init__(self, names: Iterable[str] = ()):
+        self.names: List[str] = []
+        self.ids: Dict[str, int] = {}
+        for name in names:
+            self.add(name)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def n_bytes(self) -> int:
+        """Width of a packed bitset over the whole vocabulary"""
+        return (len(self.names) + 7) // 8
+
+    def add(self, name: str) -> int:
+        skill_id = self.ids.get(name)
+        if skill_id is None:
+            skill_id = len(self.names)
+            self.names.append(name)
+            self.ids[name] = skill_id
+        return skill_id
+
+    def encode(self, skills: Iterable[str], add: bool = False) -> np.ndarray:
+        """Sorted ids of the distinct skills; unknown ones are dropped unless ``add``"""
+        # First-occurrence order keeps newly assigned ids deterministic
+        lowered = dict.fromkeys(skill.lower() for skill in skills)
+        if add:
+            ids = [self.add(skill) for skill in lowered]
+        else:
+            ids = [self.ids[skill] for skill in lowered if skill in self.ids]
+        return np.array(sorted(ids), dtype=np.int64)
+
+    def pack(self, ids: np.ndarray) -> np.ndarray:
+        """Packed bit vector of a set of ids"""
+        return pack_rows([ids], self.n_bytes)[0]
+
+    def decode(self, bits: np.ndarray) -> List[str]:
+        """Skill names whose bits are set, in vocabulary order"""
+        return [self.names[skill_id] for skill_id in np.flatnonzero(np.unpackbits(bits))]
+
+
+def pack_rows(rows: List[np.ndarray], n_bytes: int) -> np.ndarray:
+    """Pack per-row id arrays into a (rows, n_bytes) uint8 bit matrix, big-endian like np.packbits"""
+    bits = np.zeros((len(rows), n_bytes), dtype=np.uint8)
+    lengths = [len(ids) for ids in rows]
+    if sum(lengths):
+        row_index = np.repeat(np.arange(len(rows)), lengths)
+        columns = np.concatenate(rows)
+        np.bitwise_or.at(bits, (row_index, columns >> 3), (0x80 >> (columns & 7)).astype(np.uint8))
+    return bits
+
+
+def popcount_rows(bits: np.ndarray) -> np.ndarray:
+    """Number of set bits in each row of a packed matrix"""
+    return POPCOUNT_TABLE[bits].sum(axis=1, dtype=np.int64)
@@ -0,0 +1,98 @@
+from collections import deque
+from typing import Dict, List, Tuple
+
+
+class SkillMatcher:
+    """Aho-Corasick automaton over a skill taxonomy.
+
+    The automaton is built once from a ``{category: [skill, ...]}`` mapping and
+    finds every whole-word skill occurrence in a single pass over the text, so
+    matching cost depends on the text length rather than the taxonomy size.
+    """
+
+    def __init__(self, taxonomy: Dict[str, List[str]]):
+        self.categories = list(taxonomy.keys())
+        # Pattern ids are assigned in taxonomy order so results keep that order
+        self.patterns: List[Tuple[str, str]] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+
+        for category, skills in taxonomy.items():
+            for skill in skills:
+                skill = skill.lower().strip()
+                if skill:
+                    self._add_pattern(skill, len(self.patterns))
+                    self.patterns.append((category, skill))
+
+        self._build_failure_links()
+
+    def _add_pattern(self, pattern: str, pattern_id: int):
+        """Insert a pattern into the trie"""
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(pattern_id)
+
+    def _build_failure_links(self):
+        """Compute failure links breadth-first and merge suffix outputs"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(char, 0)
+                self._fail[next_state] = fail
+                self._output[next_state] = self._output[next_state] + self._output[fail]
+
+    @staticmethod
+    def _is_word_char(char: str) -> bool:
+        return char.isalnum() or char == '_'
+
+    def find_ids(self, text_lower: str) -> List[int]:
+        """Return the ids of all patterns occurring as whole words, sorted"""
+        goto, fail, output = self._goto, self._fail, self._output
+        patterns, is_word_char = self.patterns, self._is_word_char
+        text_len = len(text_lower)
+        found = set()
+        state = 0
+
+        for end, char in enumerate(text_lower):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if not output[state]:
+                continue
+
+            after_ok = end + 1 == text_len or not is_word_char(text_lower[end + 1])
+            for pattern_id in output[state]:
+                if pattern_id in found:
+                    continue
+                skill = patterns[pattern_id][1]
+                start = end - len(skill) + 1
+                # Only enforce a boundary where the skill itself starts/ends with a word char
+                if is_word_char(skill[-1]) and not after_ok:
+                    continue
+                if is_word_char(skill[0]) and start > 0 and is_word_char(text_lower[start - 1]):
+                    continue
+                found.add(pattern_id)
+
+        return sorted(found)
+
+    def find(self, text_lower: str) -> Dict[str, List[str]]:
+        """Return found skills grouped by category, in taxonomy order"""
+        found_skills = {category: [] for category in self.categories}
+        for pattern_id in self.find_ids(text_lower):
+            category, skill = self.patterns[pattern_id]
+            found_skills[category].append(skill)
+        return found_skills
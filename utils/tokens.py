@@ -0,0 +1,78 @@
+import re
+import sys
+from array import array
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional
+
+WORD_PATTERN = re.compile(r'\b\w+\b')
+
+
+class TokenStream:
+    """A resume tokenized once into an array of token ids.
+
+    Stats, entity extraction and the resume's term counts all read this
+    stream instead of re-running their own regex over the text. Ids index
+    the stream's own vocabulary of distinct tokens in first-occurrence
+    order, so nothing outlives the stream; ``counts`` is parallel to it.
+    """
+    __slots__ = ('vocab', 'ids', 'counts')
+
+    def __init__(self, vocab: List[str], ids: array, counts: array):
+        self.vocab = vocab
+        self.ids = ids
+        self.counts = counts
+
+    @classmethod
+    def from_text(cls, text: str) -> 'TokenStream':
+        """Tokenize text into word ids"""
+        words = WORD_PATTERN.findall(text)
+        # Insertion order is first-occurrence order
+        counted = Counter(words)
+        vocab = list(counted)
+        token_ids = {token: token_id for token_id, token in enumerate(vocab)}
+        return cls(vocab, array('I', map(token_ids.__getitem__, words)), array('I', counted.values()))
+
+    @classmethod
+    def term_counts_for(cls, resume_data: Dict) -> Dict[str, List]:
+        """A parsed resume's term counts, counted from its raw text if it was parsed without them"""
+        term_counts = resume_data.get('term_counts')
+        if term_counts is not None:
+            return term_counts
+        return cls.from_text(resume_data.get('raw_text', '')).term_counts()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator[str]:
+        vocab = self.vocab
+        return (vocab[token_id] for token_id in self.ids)
+
+    @property
+    def unique_count(self) -> int:
+        return len(self.vocab)
+
+    def counted(self) -> Iterator:
+        """Yield (token, count) pairs in first-occurrence order"""
+        return zip(self.vocab, self.counts)
+
+    def terms(self, stop_words: Optional[Iterable[str]] = None) -> List[str]:
+        """Lowercased terms of two or more characters, as used for TF-IDF"""
+        stop_words = stop_words or ()
+        lower = [token.lower() for token in self.vocab]
+        return [term for term in (lower[token_id] for token_id in self.ids)
+                if len(term) > 1 and term not in stop_words]
+
+    def term_counts(self) -> Dict[str, List]:
+        """Counts of the lowercased terms of two or more characters, as plain JSON-ready lists.
+
+        Computed once at parse time and kept on the parsed resume, so the job
+        matcher vectorizes it without tokenizing the text again.
+        """
+        counted = Counter()
+        for token, count in self.counted():
+            term = token.lower()
+            if len(term) > 1:
+                # Terms recur across resumes; interned, a batch holds each one once
+                counted[sys.intern(term)] += count
+        return {'terms': list(counted), 'counts': list(counted.values())}
+